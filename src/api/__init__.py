@@ -18,6 +18,10 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
 from src.api.routes import extraction, export
+from src.fetchers.yahoo import configure_yfinance
+
+# Proxy/debug settings for yfinance come from the environment loaded above
+configure_yfinance()
 
 # Create FastAPI app
 app = FastAPI(
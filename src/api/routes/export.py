@@ -7,12 +7,17 @@ Handles:
 - POST /api/export/pdf - Export to PDF report
 """
 
+import asyncio
+import functools
 import io
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 
 from src.api.routes.extraction import _sessions, _raw_data_cache
@@ -20,12 +25,49 @@ from src.calculators.metrics import calculate_metrics_from_raw
 from src.calculators.ratios import calculate_ratios_from_raw
 from src.generators.excel_export import generate_excel_report
 from src.generators.word_report import generate_word_report
-from src.generators.narrative import generate_company_narrative
+from src.generators.narrative import submit_company_narrative
 from src.fetchers.yahoo import fetch_company_info, fetch_corporate_actions, CompanyInfo
 from src.fetchers.logo import download_logo
 
 router = APIRouter()
 
+# Excel exports larger than this spill from memory to a temp file
+EXCEL_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+# Dedicated LibreOffice profile, kept across conversions so each run reuses its
+# initialized configuration and font cache instead of repeating first-run setup
+SOFFICE_PROFILE_DIR = Path(tempfile.gettempdir()) / "financial_reports" / "soffice_profile"
+
+
+# Single long-lived worker for PDF conversions: LibreOffice can't run two
+# instances on one profile, and running off the event loop keeps other
+# requests responsive while a conversion is in progress
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="soffice")
+
+
+@functools.lru_cache(maxsize=1)
+def _soffice_command() -> tuple[str, ...]:
+    """Base LibreOffice headless command (executable resolved once)."""
+    return (
+        shutil.which("soffice") or "soffice",
+        f"-env:UserInstallation={SOFFICE_PROFILE_DIR.as_uri()}",
+        "--headless",
+    )
+
+
+def _convert_to_pdf(docx_path: Path, outdir: Path) -> subprocess.CompletedProcess:
+    """Convert a .docx to PDF in outdir with headless LibreOffice (runs on _PDF_EXECUTOR)."""
+    return subprocess.run(
+        [
+            *_soffice_command(),
+            "--convert-to", "pdf",
+            "--outdir", str(outdir),
+            str(docx_path),
+        ],
+        capture_output=True,
+        timeout=60,
+    )
+
 
 class ExportExcelRequest(BaseModel):
     """Request to export to Excel."""
@@ -87,20 +129,24 @@ async def export_excel(request: ExportExcelRequest):
     )
     all_steps = metric_steps + ratio_steps
 
-    # Generate Excel file
-    excel_buffer = generate_excel_report(
+    # Generate Excel file straight into a spooled temp file
+    excel_file = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_BYTES)
+    generate_excel_report(
         session=session,
         metrics=metrics,
         ratios=ratios,
         calculation_steps=all_steps,
+        out=excel_file,
     )
+    excel_file.seek(0)
 
     # Return as streaming response
     filename = f"{session.ticker}_Financial_Analysis.xlsx"
     return StreamingResponse(
-        excel_buffer,
+        excel_file,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
+        background=BackgroundTask(excel_file.close),
     )
 
 
@@ -156,6 +202,16 @@ async def export_report(request: ExportReportRequest):
     except Exception:
         corporate_actions = []
 
+    # Start narrative generation if requested, so the LLM call overlaps the logo download
+    narrative_future = None
+    if request.include_narrative and company_info:
+        narrative_future = submit_company_narrative(
+            company_info=company_info,
+            metrics=metrics,
+            ratios=ratios,
+            corporate_actions=corporate_actions,
+        )
+
     # Download logo (with error handling)
     logo_path = None
     try:
@@ -166,16 +222,11 @@ async def export_report(request: ExportReportRequest):
     except Exception:
         pass  # Logo is optional
 
-    # Generate narrative if requested (with error handling)
+    # Collect the narrative started above (with error handling)
     narrative = None
-    if request.include_narrative and company_info:
+    if narrative_future is not None:
         try:
-            narrative = generate_company_narrative(
-                company_info=company_info,
-                metrics=metrics,
-                ratios=ratios,
-                corporate_actions=corporate_actions,
-            )
+            narrative = await asyncio.wrap_future(narrative_future)
         except Exception as e:
             narrative = f"[Narrative generation failed: {str(e)}]"
 
@@ -255,6 +306,16 @@ async def export_pdf(request: ExportReportRequest):
     except Exception:
         corporate_actions = []
 
+    # Start narrative generation if requested, so the LLM call overlaps the logo download
+    narrative_future = None
+    if request.include_narrative and company_info:
+        narrative_future = submit_company_narrative(
+            company_info=company_info,
+            metrics=metrics,
+            ratios=ratios,
+            corporate_actions=corporate_actions,
+        )
+
     # Download logo
     logo_path = None
     try:
@@ -265,16 +326,11 @@ async def export_pdf(request: ExportReportRequest):
     except Exception:
         pass
 
-    # Generate narrative if requested
+    # Collect the narrative started above
     narrative = None
-    if request.include_narrative and company_info:
+    if narrative_future is not None:
         try:
-            narrative = generate_company_narrative(
-                company_info=company_info,
-                metrics=metrics,
-                ratios=ratios,
-                corporate_actions=corporate_actions,
-            )
+            narrative = await asyncio.wrap_future(narrative_future)
         except Exception as e:
             narrative = f"[Narrative generation failed: {str(e)}]"
 
@@ -303,16 +359,8 @@ async def export_pdf(request: ExportReportRequest):
 
         # Convert to PDF using LibreOffice
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to", "pdf",
-                    "--outdir", str(tmpdir),
-                    str(docx_path),
-                ],
-                capture_output=True,
-                timeout=60,
+            result = await asyncio.get_running_loop().run_in_executor(
+                _PDF_EXECUTOR, _convert_to_pdf, docx_path, Path(tmpdir)
             )
             if result.returncode != 0:
                 raise HTTPException(
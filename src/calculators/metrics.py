@@ -20,7 +20,7 @@ from dataclasses import dataclass
 from src.models.extraction import ExtractionSession, CalculationStep
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialMetrics:
     """Calculated financial metrics for a company."""
     # Net Worth
@@ -22,7 +22,7 @@ from dataclasses import dataclass
 from src.models.extraction import ExtractionSession, CalculationStep
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialRatios:
     """Calculated financial ratios for a company."""
     # Liquidity
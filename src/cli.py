@@ -7,6 +7,7 @@ This CLI exists to test the pipeline without spinning up the full web stack.
 """
 
 import click
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -31,13 +32,17 @@ def generate(ticker, output):
     Example: uv run python -m src.cli generate AMZN
     """
     from src.extractors.llm_extractor import extract_financial_data
-    from src.fetchers.yahoo import fetch_company_info, fetch_corporate_actions
+    from src.fetchers.yahoo import configure_yfinance, fetch_company_info, fetch_corporate_actions
     from src.fetchers.logo import get_logo_url, download_logo, get_domain_from_website
     from src.generators.narrative import generate_company_narrative
     from src.generators.word_report import generate_word_report
+    from src.generators.extraction_log import GENERATED_AT_FORMAT, generate_extraction_log
 
+    configure_yfinance()
     output_path = Path(output)
     output_path.mkdir(parents=True, exist_ok=True)
+    # One timestamp for everything this run produces
+    generated_at = datetime.now().strftime(GENERATED_AT_FORMAT)
 
     click.echo(f"Generating financial report for {ticker}...")
     click.echo("-" * 50)
@@ -106,7 +111,6 @@ def generate(ticker, output):
     # Step 7: Generate extraction log
     click.echo("7. Generating extraction log...")
     log_path = output_path / f"{ticker}_Extraction_Log.docx"
-    from src.generators.extraction_log import generate_extraction_log
     generate_extraction_log(
         output_path=log_path,
         ticker=ticker,
@@ -117,6 +121,7 @@ def generate(ticker, output):
         ratios=extraction.ratios,
         notes=extraction.notes,
         warnings=extraction.warnings,
+        generated_at=generated_at,
     )
     click.echo(f"   Saved to {log_path}")
 
@@ -181,8 +186,9 @@ def info(ticker):
 
     Example: uv run python -m src.cli info AMZN
     """
-    from src.fetchers.yahoo import fetch_company_info, fetch_corporate_actions
+    from src.fetchers.yahoo import configure_yfinance, fetch_company_info, fetch_corporate_actions
 
+    configure_yfinance()
     click.echo(f"Fetching company info for {ticker}...\n")
 
     company = fetch_company_info(ticker)
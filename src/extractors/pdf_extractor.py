@@ -15,7 +15,7 @@ from io import BytesIO
 from anthropic import Anthropic
 from pypdf import PdfReader, PdfWriter
 
-from src.models.extraction import REQUIRED_BASE_METRICS, METRIC_DISPLAY_NAMES
+from src.models.extraction import REQUIRED_BASE_METRICS, REQUIRED_BASE_METRICS_SET, METRIC_DISPLAY_NAMES
 from src.extractors.session_builder import (
     NormalizedExtractionData,
     NormalizedMetric,
@@ -368,7 +368,7 @@ def pdf_to_normalized(pdf_result: PDFExtractionResult) -> NormalizedExtractionDa
     metrics = {}
 
     for metric_key, metric_data in pdf_result.metrics.items():
-        if metric_key not in REQUIRED_BASE_METRICS:
+        if metric_key not in REQUIRED_BASE_METRICS_SET:
             continue
 
         try:
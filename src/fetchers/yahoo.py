@@ -1,8 +1,149 @@
 """Yahoo Finance data fetching via yfinance."""
 
+import asyncio
+import functools
+import heapq
+import json
+import os
+import threading
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import diskcache
+import requests
 import yfinance as yf
+from yfinance.exceptions import YFException
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # optional "orjson" extra; fetch_news_json falls back to json
+    orjson = None
+
+
+# Batch fetch limits. yfinance is a blocking client, so coroutines hand each
+# request to a shared worker pool and a semaphore caps in-flight requests.
+MAX_CONCURRENT_FETCHES = 64
+FETCH_RETRIES = 3
+FETCH_BACKOFF_SECONDS = 0.5
+FETCH_TIMEOUT_SECONDS = 30.0
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix="yahoo")
+
+# On-disk cache shared across processes (CLI runs, API workers), opened on
+# first use; CREDITREVIEW_CACHE_DIR overrides the location
+DEFAULT_CACHE_DIR = "~/.cache/creditreview/yahoo"
+COMPANY_INFO_TTL = 24 * 60 * 60
+CORPORATE_ACTIONS_TTL = 6 * 60 * 60
+NEWS_TTL = 60 * 60
+_CACHE_MISS = object()
+
+# In-flight requests keyed by (fetcher, args) so concurrent callers share one
+INFLIGHT_TIMEOUT_SECONDS = 60
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+# (output key, yfinance news key) pairs kept for each news item
+_NEWS_KEY_MAP = (
+    ("title", "title"),
+    ("link", "link"),
+    ("publisher", "publisher"),
+    ("date", "providerPublishTime"),
+)
+
+
+def configure_yfinance() -> None:
+    """
+    Apply proxy and debug settings from the environment to yfinance.
+
+    Called by the entry points (CLI commands, API app) rather than at import,
+    so importing this module leaves yfinance's global config alone.
+    """
+    https_proxy = os.environ.get("HTTPS_PROXY") or os.environ.get("https_proxy")
+    http_proxy = os.environ.get("HTTP_PROXY") or os.environ.get("http_proxy")
+    if https_proxy or http_proxy:
+        yf.config.network.proxy = {
+            "http": http_proxy or https_proxy,
+            "https": https_proxy or http_proxy,
+        }
+
+    if os.environ.get("CREDITREVIEW_DEBUG"):
+        yf.config.debug.logging = True
+
+
+@functools.cache
+def _disk_cache() -> diskcache.Cache | None:
+    """Open the on-disk cache; None (caching disabled) if its directory cannot be created."""
+    path = os.path.expanduser(os.environ.get("CREDITREVIEW_CACHE_DIR") or DEFAULT_CACHE_DIR)
+    try:
+        return diskcache.Cache(path)
+    except OSError as exc:
+        warnings.warn(f"Yahoo Finance cache disabled ({path}): {exc!r}")
+        return None
+
+
+def _disk_memoized(expire: int, keep=bool):
+    """
+    Decorator caching a fetcher's result on disk for expire seconds, keyed by its arguments.
+
+    Results for which keep(result) is false (empty lookups, e.g. during a
+    Yahoo outage) are returned but not stored, so the next call retries.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = _disk_cache()
+            if cache is None:
+                return fn(*args, **kwargs)
+
+            key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            result = cache.get(key, default=_CACHE_MISS)
+            if result is _CACHE_MISS:
+                result = fn(*args, **kwargs)
+                if keep(result):
+                    cache.set(key, result, expire=expire)
+            return result
+        return wrapper
+    return decorator
+
+
+def _singleflight(key: tuple, fn):
+    """
+    Run fn once per key across concurrent callers.
+
+    The first caller for a key runs fn; callers arriving while it is in
+    flight wait on the same Future and get its result (or exception).
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+
+    if not is_leader:
+        return future.result(timeout=INFLIGHT_TIMEOUT_SECONDS)
+
+    try:
+        result = fn()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _coalesced(fn):
+    """Decorator routing a fetcher through _singleflight, keyed by its arguments."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        return _singleflight(key, lambda: fn(*args, **kwargs))
+    return wrapper
+
 
 @dataclass
 class CompanyInfo:
@@ -28,6 +169,8 @@ class CorporateAction:
     value: float | None = None
 
 
+@_disk_memoized(COMPANY_INFO_TTL, keep=lambda info: bool(info.name))
+@_coalesced
 def fetch_company_info(ticker: str) -> CompanyInfo:
     """
     Fetch company information from Yahoo Finance.
@@ -38,8 +181,7 @@ def fetch_company_info(ticker: str) -> CompanyInfo:
     Returns:
         CompanyInfo with company details
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    info = yf.Ticker(ticker).info
 
     return CompanyInfo(
         name=info.get("longName", ""),
@@ -55,6 +197,8 @@ def fetch_company_info(ticker: str) -> CompanyInfo:
     )
 
 
+@_disk_memoized(CORPORATE_ACTIONS_TTL)
+@_coalesced
 def fetch_corporate_actions(ticker: str, limit: int = 10) -> list[CorporateAction]:
     """
     Fetch recent corporate actions from Yahoo Finance.
@@ -66,6 +210,9 @@ def fetch_corporate_actions(ticker: str, limit: int = 10) -> list[CorporateActio
     Returns:
         List of CorporateAction events
     """
+    if limit <= 0:
+        return []
+
     stock = yf.Ticker(ticker)
     actions = []
 
@@ -91,11 +238,12 @@ def fetch_corporate_actions(ticker: str, limit: int = 10) -> list[CorporateActio
                 value=float(value),
             ))
 
-    # Sort by date descending and limit
-    actions.sort(key=lambda x: x.date, reverse=True)
-    return actions[:limit]
+    # Most recent first, limited (ISO date strings sort chronologically)
+    return heapq.nlargest(limit, actions, key=lambda x: x.date)
 
 
+@_disk_memoized(NEWS_TTL)
+@_coalesced
 def fetch_news(ticker: str, limit: int = 5) -> list[dict]:
     """
     Fetch recent news for a company.
@@ -107,15 +255,153 @@ def fetch_news(ticker: str, limit: int = 5) -> list[dict]:
     Returns:
         List of news items with title, link, publisher, date
     """
-    stock = yf.Ticker(ticker)
-    news = stock.news[:limit] if stock.news else []
-
-    return [
-        {
-            "title": item.get("title", ""),
-            "link": item.get("link", ""),
-            "publisher": item.get("publisher", ""),
-            "date": item.get("providerPublishTime", ""),
-        }
-        for item in news
-    ]
+    if limit <= 0:
+        return []
+
+    news = yf.Ticker(ticker).news
+    news = news[:limit] if news else []
+
+    return [{key: item.get(source_key, "") for key, source_key in _NEWS_KEY_MAP} for item in news]
+
+
+def fetch_news_json(ticker: str, limit: int = 5) -> bytes:
+    """
+    Fetch recent news for a company, serialized as JSON.
+
+    Args:
+        ticker: Stock ticker symbol
+        limit: Maximum number of news items
+
+    Returns:
+        UTF-8 encoded JSON array of news items (see fetch_news)
+    """
+    news = fetch_news(ticker, limit)
+    if orjson is not None:
+        return orjson.dumps(news)
+    return json.dumps(news, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+async def _fetch_with_retry(
+    fetcher,
+    ticker: str,
+    semaphore: asyncio.Semaphore,
+    timeout: float,
+):
+    """
+    Run a blocking fetcher for one ticker inside a batch.
+
+    Connection errors and timeouts are retried with exponential backoff.
+    Expected per-ticker failures (HTTP errors, bad payloads, yfinance errors)
+    are reported with warnings.warn() and yield None so one bad ticker does
+    not fail the whole batch; anything else is a bug and propagates.
+    """
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        for attempt in range(FETCH_RETRIES):
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(_EXECUTOR, fetcher, ticker),
+                    timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout, TimeoutError) as exc:
+                if attempt == FETCH_RETRIES - 1:
+                    warnings.warn(f"{ticker}: {exc!r}")
+                    return None
+                await asyncio.sleep(FETCH_BACKOFF_SECONDS * 2 ** attempt)
+            except (requests.HTTPError, ValueError, KeyError, YFException) as exc:
+                # HTTP errors, bad payloads (JSONDecodeError is a ValueError)
+                # and yfinance errors are not worth retrying; skip this ticker
+                warnings.warn(f"{ticker}: {exc!r}")
+                return None
+
+
+async def fetch_company_info_async(
+    tickers: list[str],
+    max_concurrency: int = MAX_CONCURRENT_FETCHES,
+    timeout: float = FETCH_TIMEOUT_SECONDS,
+) -> dict[str, CompanyInfo]:
+    """
+    Fetch company information for many tickers concurrently.
+
+    Args:
+        tickers: Stock ticker symbols
+        max_concurrency: Maximum number of requests in flight at once
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Dict mapping ticker to CompanyInfo; tickers that failed are omitted
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = await asyncio.gather(
+        *(_fetch_with_retry(fetch_company_info, ticker, semaphore, timeout) for ticker in tickers)
+    )
+    return {ticker: info for ticker, info in zip(tickers, results) if info is not None}
+
+
+def fetch_company_info_many(
+    tickers: list[str],
+    timeout: float = FETCH_TIMEOUT_SECONDS,
+) -> dict[str, CompanyInfo]:
+    """
+    Synchronous wrapper around fetch_company_info_async.
+
+    Runs its own event loop, so it must not be called while one is already
+    running (e.g. from a FastAPI route); await fetch_company_info_async there.
+
+    Args:
+        tickers: Stock ticker symbols
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Dict mapping ticker to CompanyInfo; tickers that failed are omitted
+
+    Raises:
+        RuntimeError: If called from a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(fetch_company_info_async(tickers, timeout=timeout))
+    raise RuntimeError(
+        "fetch_company_info_many() cannot be called from a running event loop; "
+        "await fetch_company_info_async() instead"
+    )
+
+
+def _warn_on_failure(ticker: str, future: Future) -> None:
+    """Done-callback that surfaces a failed background fetch as a warning."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        warnings.warn(f"warmup failed {ticker}: {exc}")
+
+
+def warmup(
+    tickers: list[str],
+    include: tuple[str, ...] = ("info", "actions", "news"),
+) -> list[Future]:
+    """
+    Prefetch Yahoo Finance data for a watchlist in the background.
+
+    Fills the on-disk cache so later calls for these tickers are cache hits.
+
+    Args:
+        tickers: Stock ticker symbols
+        include: Which fetches to run ("info", "actions", "news")
+
+    Returns:
+        List of Futures; callers may wait on them or ignore them
+    """
+    fetchers = {
+        "info": fetch_company_info,
+        "actions": fetch_corporate_actions,
+        "news": fetch_news,
+    }
+    futures = []
+    for ticker in tickers:
+        for kind in include:
+            future = _EXECUTOR.submit(fetchers[kind], ticker)
+            future.add_done_callback(functools.partial(_warn_on_failure, ticker))
+            futures.append(future)
+    return futures
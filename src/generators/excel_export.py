@@ -13,9 +13,17 @@ All calculated cells use real Excel formulas, so users can:
 - Audit the entire calculation chain
 """
 
+import functools
 import io
+import weakref
+from copy import copy
+from typing import BinaryIO
+from dataclasses import dataclass
+
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.utils import get_column_letter
 
 from src.models.extraction import (
@@ -31,34 +39,163 @@ from src.calculators.ratios import FinancialRatios
 from src.calculators.verification import VerificationResult
 
 
+# Colors as explicit 8-char ARGB: openpyxl pads 6-char RGB codes with a 00
+# (fully transparent) alpha, which some viewers honour
+DARK_BLUE = "FF1F4E79"
+WHITE = "FFFFFFFF"
+LIGHT_GREEN = "FFC6EFCE"
+LIGHT_RED = "FFFFC7CE"
+LIGHT_YELLOW = "FFFFFFCC"
+LIGHT_BLUE = "FFD9E2F3"
+DARK_GREEN = "FF006100"
+DARK_RED = "FF9C0006"
+GREY = "FF808080"
+DARK_GREY = "FF666666"
+assert all(
+    len(c) == 8
+    for c in (DARK_BLUE, WHITE, LIGHT_GREEN, LIGHT_RED, LIGHT_YELLOW, LIGHT_BLUE,
+              DARK_GREEN, DARK_RED, GREY, DARK_GREY)
+), "style colors must be 8-char ARGB"
+
 # Style constants
-HEADER_FILL = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
-HEADER_FONT = Font(color="FFFFFF", bold=True)
-POSITIVE_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-NEGATIVE_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-FORMULA_FILL = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
+HEADER_FILL = PatternFill(start_color=DARK_BLUE, end_color=DARK_BLUE, fill_type="solid")
+HEADER_FONT = Font(color=WHITE, bold=True)
+POSITIVE_FILL = PatternFill(start_color=LIGHT_GREEN, end_color=LIGHT_GREEN, fill_type="solid")
+NEGATIVE_FILL = PatternFill(start_color=LIGHT_RED, end_color=LIGHT_RED, fill_type="solid")
+FORMULA_FILL = PatternFill(start_color=LIGHT_YELLOW, end_color=LIGHT_YELLOW, fill_type="solid")
 THIN_BORDER = Border(
     left=Side(style='thin'),
     right=Side(style='thin'),
     top=Side(style='thin'),
     bottom=Side(style='thin')
 )
+RIGHT_ALIGN = Alignment(horizontal="right")
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+NOTE_FONT = Font(italic=True, color=GREY, size=10)
+BOLD_FONT = Font(bold=True)
+SECTION_LABEL_FONT = Font(bold=True, color=DARK_BLUE)
+
+# Verification / audit sheet styles
+TITLE_FONT = Font(bold=True, size=12, color=DARK_BLUE)
+PASS_FONT = Font(color=DARK_GREEN, bold=True)
+FAIL_FONT = Font(color=DARK_RED, bold=True)
+SKIP_FONT = Font(color=GREY)
+PASS_FILL = PatternFill(start_color=LIGHT_GREEN, end_color=LIGHT_GREEN, fill_type="solid")
+FAIL_FILL = PatternFill(start_color=LIGHT_RED, end_color=LIGHT_RED, fill_type="solid")
+SUMMARY_PASS_FONT = Font(color=DARK_GREEN)
+SUMMARY_FAIL_FONT = Font(color=DARK_RED)
+SUMMARY_SKIP_FONT = Font(color=GREY)
+AUDIT_NOTE_FONT = Font(italic=True, color=DARK_GREY)
+
+# Number format codes. These are set per cell: a column-level style only
+# applies to cells Excel creates later, any written cell without its own
+# style falls back to style 0 ("General"). The builtin codes (FMT_INT,
+# FMT_DECIMAL, FMT_PCT, FMT_RATIO) resolve to a fixed numFmtId without
+# touching the workbook's custom format table.
+FMT_INT = '#,##0'
+FMT_DECIMAL = '#,##0.00'
+FMT_PCT = '0.00%'
+FMT_RATIO = '0.00'
+FMT_DAYS = '0.0'
+FMT_DELTA_RATIO = '+0.00;-0.00'
+FMT_DELTA_PCT = '+0.00%;-0.00%'
+FMT_DELTA_DAYS = '+0.0;-0.0'
+
+# Output buffer sizing: rough bytes per raw value row / audit step on top of
+# the fixed workbook overhead, clamped to a sane range
+BUFFER_MIN_BYTES = 64 * 1024
+BUFFER_MAX_BYTES = 8 * 1024 * 1024
+
+# Column letters by 1-based index (COL_LETTERS[1] == "A"), computed once
+COL_LETTERS = ("",) + tuple(get_column_letter(i) for i in range(1, 65))
+
+# Supported workbook writers for generate_excel_report
+ENGINES = ("openpyxl", "xlsxwriter")
+
+
+# Registered StyleArrays for the fixed header / formula styles, per workbook
+# (style indices are workbook-specific)
+_STYLE_ARRAYS = weakref.WeakKeyDictionary()
+
+
+def _register_styles(ws) -> dict[str, StyleArray]:
+    """Register the fixed cell styles on ws's workbook and return their StyleArrays."""
+    header = WriteOnlyCell(ws)
+    header.fill = HEADER_FILL
+    header.font = HEADER_FONT
+    header.alignment = CENTER_ALIGN
+    header.border = THIN_BORDER
+
+    formula = WriteOnlyCell(ws)
+    formula.border = THIN_BORDER
+    formula.alignment = RIGHT_ALIGN
+    formula.fill = FORMULA_FILL
+
+    # Verification / audit table cells: border, plus the number format
+    # for the numeric columns
+    bordered = WriteOnlyCell(ws)
+    bordered.border = THIN_BORDER
+    bordered_int = WriteOnlyCell(ws)
+    bordered_int.border = THIN_BORDER
+    bordered_int.number_format = FMT_INT
+    bordered_decimal = WriteOnlyCell(ws)
+    bordered_decimal.border = THIN_BORDER
+    bordered_decimal.number_format = FMT_DECIMAL
+
+    return {
+        "header": header._style,
+        "formula": formula._style,
+        "bordered": bordered._style,
+        "bordered_int": bordered_int._style,
+        "bordered_decimal": bordered_decimal._style,
+    }
+
+
+def _style_array(ws, name: str) -> StyleArray:
+    """A fresh copy of a registered StyleArray, safe to mutate per cell."""
+    wb = ws.parent
+    styles = _STYLE_ARRAYS.get(wb)
+    if styles is None:
+        styles = _STYLE_ARRAYS[wb] = _register_styles(ws)
+    return copy(styles[name])
 
 
-def _apply_header_style(cell):
-    """Apply header styling to a cell."""
-    cell.fill = HEADER_FILL
-    cell.font = HEADER_FONT
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+def _apply_data_style(cell, is_formula=False):
+    """Apply data cell styling (formula styling replaces any style already set)."""
+    if is_formula:
+        cell._style = _style_array(cell.parent, "formula")
+        return
     cell.border = THIN_BORDER
+    cell.alignment = RIGHT_ALIGN
 
 
-def _apply_data_style(cell, is_formula=False):
-    """Apply data cell styling."""
-    cell.border = THIN_BORDER
-    cell.alignment = Alignment(horizontal="right")
-    if is_formula:
-        cell.fill = FORMULA_FILL
+def _apply_formula_style(cells):
+    """Apply formula data styling (border, alignment, fill) to several cells in one pass."""
+    for cell in cells:
+        cell._style = _style_array(cell.parent, "formula")
+
+
+def _styled_cell(ws, value, style: str) -> WriteOnlyCell:
+    """Build a cell with one of the workbook's registered styles (see _register_styles)."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell._style = _style_array(ws, style)
+    return cell
+
+
+def _header_cell(ws, value) -> WriteOnlyCell:
+    """Build a header cell sharing the workbook's registered header style."""
+    return _styled_cell(ws, value, "header")
+
+
+def _header_row(ws, headers: list[str]) -> list[WriteOnlyCell]:
+    """Build a row of styled header cells."""
+    return [_header_cell(ws, header) for header in headers]
+
+
+@functools.lru_cache(maxsize=256)
+def _delta_formula(row: int) -> str:
+    """YoY delta formula (current - prior) for a row; shared across sheets and workbooks."""
+    return f"=B{row}-C{row}"
 
 
 def _format_number(value: float, is_currency: bool = True, is_percentage: bool = False) -> str:
@@ -81,7 +218,9 @@ def generate_excel_report(
     ratios: FinancialRatios,
     calculation_steps: list[CalculationStep],
     verification: VerificationResult = None,
-) -> io.BytesIO:
+    engine: str = "openpyxl",
+    out: BinaryIO | None = None,
+) -> io.BytesIO | None:
     """
     Generate an Excel workbook with financial data and formulas.
 
@@ -91,287 +230,302 @@ def generate_excel_report(
         ratios: Calculated financial ratios
         calculation_steps: Audit trail of calculations
         verification: Optional verification results
+        engine: "openpyxl" (default) or "xlsxwriter" (faster for large
+            workbooks; requires the optional xlsxwriter package)
+        out: Optional binary file object to write the workbook to directly
+            (e.g. a temp file), instead of buffering it in memory
 
     Returns:
-        BytesIO buffer containing the Excel file
+        BytesIO buffer containing the Excel file, or None when written to out
     """
-    wb = Workbook()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown Excel engine: {engine!r} (expected one of {', '.join(ENGINES)})")
+
+    # Pre-size the output buffer so the zip writer doesn't repeatedly grow it
+    if out is None:
+        buffer = _presized_buffer(
+            len(session.raw_values) * 150 + len(calculation_steps) * 120 + 32_768
+        )
+    else:
+        buffer = out
 
-    # Remove default sheet
-    wb.remove(wb.active)
+    if engine == "xlsxwriter":
+        from src.generators.xlsxwriter_engine import XlsxWriterWorkbook
+        wb = XlsxWriterWorkbook(buffer)
+    else:
+        # Write-only workbooks stream rows straight to XML instead of keeping
+        # every cell in memory, and start with no sheets.
+        wb = Workbook(write_only=True)
 
     # Create sheets
     _create_raw_values_sheet(wb, session)
-    _create_statement_sheet(wb, session, "Income Statement", INCOME_STATEMENT_ITEMS)
-    _create_statement_sheet(wb, session, "Balance Sheet", BALANCE_SHEET_ITEMS)
-    _create_statement_sheet(wb, session, "Cash Flow", CASH_FLOW_ITEMS)
+    _create_statement_sheet(wb, session, "Income Statement", INCOME_STATEMENT_SHEET_ROWS)
+    _create_statement_sheet(wb, session, "Balance Sheet", BALANCE_SHEET_SHEET_ROWS)
+    _create_statement_sheet(wb, session, "Cash Flow", CASH_FLOW_SHEET_ROWS)
     _create_metrics_sheet(wb, session, metrics)
     _create_ratios_sheet(wb, session, ratios, metrics)
     if verification:
         _create_verification_sheet(wb, verification)
     _create_audit_sheet(wb, calculation_steps)
 
-    # Save to buffer
-    buffer = io.BytesIO()
     wb.save(buffer)
+    if out is not None:
+        return None
+
+    # Drop the unused tail of the pre-sized buffer
+    buffer.truncate(buffer.tell())
     buffer.seek(0)
 
     return buffer
 
 
+def _presized_buffer(size_hint: int) -> io.BytesIO:
+    """Create a BytesIO with its storage allocated up front (clamped to BUFFER_MIN/MAX_BYTES)."""
+    size = min(max(size_hint, BUFFER_MIN_BYTES), BUFFER_MAX_BYTES)
+    return io.BytesIO(bytes(size))
+
+
 def _create_raw_values_sheet(wb: Workbook, session: ExtractionSession):
     """Create the Raw Values sheet with source citations."""
     ws = wb.create_sheet("Raw Values")
 
+    # Column widths must be set before the first row is written
+    for col in range(1, 7):
+        ws.column_dimensions[COL_LETTERS[col]].width = 20
+
     # Add unit note if not in dollars
     if session.unit and session.unit.lower() != "dollars":
-        note_cell = ws.cell(row=1, column=1, value=f"All figures are in {session.unit}")
-        note_cell.font = Font(italic=True, color="808080", size=10)
+        note_cell = WriteOnlyCell(ws, value=f"All figures are in {session.unit}")
+        note_cell.font = NOTE_FONT
         ws.row_dimensions[1].height = 20
+        ws.append([note_cell])
 
-    # Headers (starting at row 2 or 1 depending on unit note)
-    header_row = 2 if (session.unit and session.unit.lower() != "dollars") else 1
+    # Headers (row 2 or 1 depending on unit note)
     headers = ["Metric", "Current Value", "Prior Value", "XBRL Concept", "Filing Date", "SEC Link"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=header_row, column=col, value=header)
-        _apply_header_style(cell)
-
-    # Data rows
-    row = header_row + 1
-    for metric_key, ev in session.raw_values.items():
-        ws.cell(row=row, column=1, value=ev.display_name)
-        ws.cell(row=row, column=2, value=ev.value)
-        ws.cell(row=row, column=3, value=ev.value_prior)
+    ws.append(_header_row(ws, headers))
 
+    # Data rows. Plain values go straight to ws.append(), which serializes
+    # them with lxml's xmlfile; only the formatted numbers need cell objects.
+    for ev in session.raw_values.values():
+        row = [ev.display_name, _number_cell(ws, ev.value), _number_cell(ws, ev.value_prior)]
         if ev.citation:
-            ws.cell(row=row, column=4, value=ev.citation.xbrl_concept)
-            ws.cell(row=row, column=5, value=ev.citation.filing_date)
-            ws.cell(row=row, column=6, value=ev.citation.filing_url)
-
-        # Apply number format
-        ws.cell(row=row, column=2).number_format = '#,##0'
-        ws.cell(row=row, column=3).number_format = '#,##0'
-
-        row += 1
+            row += [ev.citation.xbrl_concept, ev.citation.filing_date, ev.citation.filing_url]
+        ws.append(row)
 
     # Add company info header
-    row += 2
-    ws.cell(row=row, column=1, value="Company Information").font = Font(bold=True)
-    row += 1
-    ws.cell(row=row, column=1, value="Ticker")
-    ws.cell(row=row, column=2, value=session.ticker)
-    row += 1
-    ws.cell(row=row, column=1, value="Company Name")
-    ws.cell(row=row, column=2, value=session.company_name)
-    row += 1
-    ws.cell(row=row, column=1, value="CIK")
-    ws.cell(row=row, column=2, value=session.cik)
-    row += 1
-    ws.cell(row=row, column=1, value="Fiscal Year End")
-    ws.cell(row=row, column=2, value=session.fiscal_year_end)
-    row += 1
-    ws.cell(row=row, column=1, value="Prior Fiscal Year End")
-    ws.cell(row=row, column=2, value=session.fiscal_year_end_prior)
+    ws.append([])
+    ws.append([])
+    title_cell = WriteOnlyCell(ws, value="Company Information")
+    title_cell.font = BOLD_FONT
+    ws.append([title_cell])
+    ws.append(["Ticker", session.ticker])
+    ws.append(["Company Name", session.company_name])
+    ws.append(["CIK", session.cik])
+    ws.append(["Fiscal Year End", session.fiscal_year_end])
+    ws.append(["Prior Fiscal Year End", session.fiscal_year_end_prior])
+
+
+def _number_cell(ws, value, number_format: str = FMT_INT):
+    """
+    Build a number-formatted cell, or None for a missing value.
 
-    # Auto-fit columns
-    for col in range(1, 7):
-        ws.column_dimensions[get_column_letter(col)].width = 20
+    Empty cells don't need a format, and an unstyled None is skipped
+    entirely by ws.append() instead of being written as a styled blank.
+    """
+    if value is None:
+        return None
+    cell = WriteOnlyCell(ws, value=value)
+    cell.number_format = number_format
+    return cell
+
+
+def _section_label(ws, text: str) -> WriteOnlyCell:
+    """Build a bold section label cell (e.g. "RAW VALUES (from XBRL)")."""
+    cell = WriteOnlyCell(ws, value=text)
+    cell.font = SECTION_LABEL_FONT
+    return cell
+
+
+def _raw_value_row(ws, row: int, ev, description: str | None = None) -> list:
+    """Build a raw value row (label, current, prior, delta formula[, description])."""
+    delta = WriteOnlyCell(ws, value=_delta_formula(row))
+    _apply_data_style(delta, is_formula=True)
+    delta.number_format = FMT_INT
+
+    cells = [ev.display_name, _number_cell(ws, ev.value), _number_cell(ws, ev.value_prior), delta]
+    if description is not None:
+        cells.append(description)
+    return cells
+
+
+@dataclass(frozen=True)
+class MetricRow:
+    """Spec for one calculated row on the Calculated Metrics / Ratios sheets."""
+    label: str
+    operands: tuple[str, ...]   # raw_row_map keys the formula references
+    formula: str                # Template; {c} is the column, operands are row numbers
+    attr: str                   # Fallback attribute (and attr + "_prior") when operands are missing
+    description: str
+    number_format: str
+    delta_format: str | None = None
+    row_key: str | None = None  # Record this row in raw_row_map for later formulas
+
+
+METRIC_ROWS = (
+    MetricRow("Gross Profit Margin", ("gross_profit", "revenue"),
+              "={c}{gross_profit}/{c}{revenue}", "gross_profit_margin",
+              "Gross Profit / Revenue", FMT_PCT),
+    MetricRow("Operating Income Margin", ("operating_income", "revenue"),
+              "={c}{operating_income}/{c}{revenue}", "operating_income_margin",
+              "Operating Income / Revenue", FMT_PCT),
+    MetricRow("EBITDA", ("operating_income", "depreciation_amortization"),
+              "={c}{operating_income}+{c}{depreciation_amortization}", "ebitda",
+              "Operating Income + D&A", FMT_INT, row_key="ebitda"),
+    MetricRow("EBITDA Margin", ("ebitda", "revenue"),
+              "={c}{ebitda}/{c}{revenue}", "ebitda_margin",
+              "EBITDA / Revenue", FMT_PCT),
+    MetricRow("Adjusted EBITDA", ("ebitda", "stock_compensation"),
+              "={c}{ebitda}+{c}{stock_compensation}", "adjusted_ebitda",
+              "EBITDA + Stock Compensation", FMT_INT),
+    MetricRow("Net Income Margin", ("net_income", "revenue"),
+              "={c}{net_income}/{c}{revenue}", "net_income_margin",
+              "Net Income / Revenue", FMT_PCT),
+    MetricRow("Tangible Net Worth", ("stockholders_equity", "intangible_assets", "goodwill"),
+              "={c}{stockholders_equity}-{c}{intangible_assets}-{c}{goodwill}", "tangible_net_worth",
+              "Equity - Intangibles - Goodwill", FMT_INT),
+)
 
+RATIO_ROWS = (
+    MetricRow("Current Ratio", ("current_assets", "current_liabilities"),
+              "={c}{current_assets}/{c}{current_liabilities}", "current_ratio",
+              "Current Assets / Current Liabilities", FMT_RATIO, FMT_DELTA_RATIO),
+    MetricRow("Cash Ratio", ("cash", "current_liabilities"),
+              "={c}{cash}/{c}{current_liabilities}", "cash_ratio",
+              "Cash / Current Liabilities", FMT_RATIO, FMT_DELTA_RATIO),
+    MetricRow("Debt-to-Equity", ("total_debt", "stockholders_equity"),
+              "={c}{total_debt}/{c}{stockholders_equity}", "debt_to_equity",
+              "Total Debt / Stockholders' Equity", FMT_RATIO, FMT_DELTA_RATIO),
+    MetricRow("EBITDA Interest Coverage", ("ebitda", "interest_expense"),
+              "={c}{ebitda}/{c}{interest_expense}", "ebitda_interest_coverage",
+              "EBITDA / Interest Expense", FMT_RATIO, FMT_DELTA_RATIO),
+    MetricRow("Net Debt / EBITDA", ("total_debt", "cash", "ebitda"),
+              "=({c}{total_debt}-{c}{cash})/{c}{ebitda}", "net_debt_to_ebitda",
+              "(Total Debt - Cash) / EBITDA", FMT_RATIO, FMT_DELTA_RATIO),
+    MetricRow("Days Sales Outstanding", ("accounts_receivable", "revenue"),
+              "=({c}{accounts_receivable}/{c}{revenue})*365", "days_sales_outstanding",
+              "(A/R / Revenue) × 365", FMT_DAYS, FMT_DELTA_DAYS),
+    MetricRow("Working Capital", ("current_assets", "current_liabilities"),
+              "={c}{current_assets}-{c}{current_liabilities}", "working_capital",
+              "Current Assets - Current Liabilities", FMT_INT),
+    MetricRow("Return on Assets", ("net_income", "total_assets"),
+              "={c}{net_income}/{c}{total_assets}", "return_on_assets",
+              "Net Income / Total Assets", FMT_PCT, FMT_DELTA_PCT),
+    MetricRow("Return on Equity", ("net_income", "stockholders_equity"),
+              "={c}{net_income}/{c}{stockholders_equity}", "return_on_equity",
+              "Net Income / Stockholders' Equity", FMT_PCT, FMT_DELTA_PCT),
+)
 
-def _create_metrics_sheet(wb: Workbook, session: ExtractionSession, metrics: FinancialMetrics):
-    """Create the Calculated Metrics sheet with Excel formulas."""
-    ws = wb.create_sheet("Calculated Metrics")
 
-    # Create a mapping of raw values to row numbers for formulas
-    # First, list the raw value rows
-    raw_row_map = {}
+# Raw values shown (in this order) at the top of the Calculated Metrics / Ratios sheets
+METRICS_RAW_KEYS = (
+    "revenue", "cost_of_revenue", "gross_profit", "operating_income",
+    "depreciation_amortization", "net_income", "stockholders_equity",
+    "intangible_assets", "goodwill", "cash", "stock_compensation",
+)
+RATIOS_RAW_KEYS = (
+    "current_assets", "current_liabilities", "cash", "total_debt",
+    "stockholders_equity", "interest_expense", "accounts_receivable",
+    "revenue", "net_income", "total_assets",
+)
 
-    # Headers
-    headers = ["Metric", "Current", "Prior", "YoY Delta", "Formula"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        _apply_header_style(cell)
 
-    # Raw values section
-    ws.cell(row=3, column=1, value="RAW VALUES (from XBRL)").font = Font(bold=True, color="1F4E79")
-
-    row = 4
-    raw_metrics = ["revenue", "cost_of_revenue", "gross_profit", "operating_income",
-                   "depreciation_amortization", "net_income", "stockholders_equity",
-                   "intangible_assets", "goodwill", "cash", "stock_compensation"]
-
-    for metric_key in raw_metrics:
-        if metric_key in session.raw_values:
-            ev = session.raw_values[metric_key]
-            raw_row_map[metric_key] = row
-            ws.cell(row=row, column=1, value=ev.display_name)
-            ws.cell(row=row, column=2, value=ev.value)
-            ws.cell(row=row, column=3, value=ev.value_prior)
-            # Delta formula
-            ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-            _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-            ws.cell(row=row, column=5, value="Raw value from SEC filing")
-
-            # Number formats
-            ws.cell(row=row, column=2).number_format = '#,##0'
-            ws.cell(row=row, column=3).number_format = '#,##0'
-            ws.cell(row=row, column=4).number_format = '#,##0'
+def _present_raw_values(session: ExtractionSession, keys: tuple[str, ...]) -> list:
+    """(key, ExtractedValue) pairs for the keys present in the session, in order."""
+    raw_values = session.raw_values
+    return [(key, raw_values[key]) for key in keys if key in raw_values]
 
-            row += 1
 
-    # Calculated metrics section
-    row += 1
-    ws.cell(row=row, column=1, value="CALCULATED METRICS").font = Font(bold=True, color="1F4E79")
-    row += 1
+def _emit_metric_row(ws, row: int, raw_row_map: dict[str, int], source, spec: MetricRow):
+    """
+    Append one calculated metric/ratio row.
 
-    # Gross Margin
-    ws.cell(row=row, column=1, value="Gross Profit Margin")
-    if "gross_profit" in raw_row_map and "revenue" in raw_row_map:
-        gp_row = raw_row_map["gross_profit"]
-        rev_row = raw_row_map["revenue"]
-        ws.cell(row=row, column=2, value=f"=B{gp_row}/B{rev_row}")
-        ws.cell(row=row, column=3, value=f"=C{gp_row}/C{rev_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
+    Current/prior are Excel formulas over the raw value rows when every
+    operand is on the sheet, otherwise the pre-calculated values from
+    source (FinancialMetrics or FinancialRatios). The YoY delta is always
+    a formula.
+    """
+    # Resolve each operand's row once; a missing operand falls back to source
+    operand_rows = {}
+    for key in spec.operands:
+        operand_row = raw_row_map.get(key)
+        if operand_row is None:
+            break
+        operand_rows[key] = operand_row
+
+    is_formula = len(operand_rows) == len(spec.operands)
+    if is_formula:
+        formula = spec.formula
+        current = formula.format(c="B", **operand_rows)
+        prior = formula.format(c="C", **operand_rows)
     else:
-        ws.cell(row=row, column=2, value=metrics.gross_profit_margin)
-        ws.cell(row=row, column=3, value=metrics.gross_profit_margin_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Gross Profit / Revenue")
-    ws.cell(row=row, column=2).number_format = '0.00%'
-    ws.cell(row=row, column=3).number_format = '0.00%'
-    ws.cell(row=row, column=4).number_format = '0.00%'
-    gross_margin_row = row
-    row += 1
+        attr = spec.attr
+        current = getattr(source, attr)
+        prior = getattr(source, f"{attr}_prior")
 
-    # Operating Margin
-    ws.cell(row=row, column=1, value="Operating Income Margin")
-    if "operating_income" in raw_row_map and "revenue" in raw_row_map:
-        oi_row = raw_row_map["operating_income"]
-        rev_row = raw_row_map["revenue"]
-        ws.cell(row=row, column=2, value=f"=B{oi_row}/B{rev_row}")
-        ws.cell(row=row, column=3, value=f"=C{oi_row}/C{rev_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=metrics.operating_income_margin)
-        ws.cell(row=row, column=3, value=metrics.operating_income_margin_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Operating Income / Revenue")
-    ws.cell(row=row, column=2).number_format = '0.00%'
-    ws.cell(row=row, column=3).number_format = '0.00%'
-    ws.cell(row=row, column=4).number_format = '0.00%'
-    row += 1
+    if spec.row_key:
+        raw_row_map[spec.row_key] = row
 
-    # EBITDA
-    ws.cell(row=row, column=1, value="EBITDA")
-    if "operating_income" in raw_row_map and "depreciation_amortization" in raw_row_map:
-        oi_row = raw_row_map["operating_income"]
-        da_row = raw_row_map["depreciation_amortization"]
-        ws.cell(row=row, column=2, value=f"=B{oi_row}+B{da_row}")
-        ws.cell(row=row, column=3, value=f"=C{oi_row}+C{da_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=metrics.ebitda)
-        ws.cell(row=row, column=3, value=metrics.ebitda_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Operating Income + D&A")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=3).number_format = '#,##0'
-    ws.cell(row=row, column=4).number_format = '#,##0'
-    ebitda_row = row
-    row += 1
+    current_cell = WriteOnlyCell(ws, value=current)
+    prior_cell = WriteOnlyCell(ws, value=prior)
+    delta_cell = WriteOnlyCell(ws, value=_delta_formula(row))
 
-    # EBITDA Margin
-    ws.cell(row=row, column=1, value="EBITDA Margin")
-    if "revenue" in raw_row_map:
-        rev_row = raw_row_map["revenue"]
-        ws.cell(row=row, column=2, value=f"=B{ebitda_row}/B{rev_row}")
-        ws.cell(row=row, column=3, value=f"=C{ebitda_row}/C{rev_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=metrics.ebitda_margin)
-        ws.cell(row=row, column=3, value=metrics.ebitda_margin_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="EBITDA / Revenue")
-    ws.cell(row=row, column=2).number_format = '0.00%'
-    ws.cell(row=row, column=3).number_format = '0.00%'
-    ws.cell(row=row, column=4).number_format = '0.00%'
-    row += 1
+    # Formula cells get the data style in one pass; values from source stay plain
+    _apply_formula_style(
+        (current_cell, prior_cell, delta_cell) if is_formula else (delta_cell,)
+    )
 
-    # Adjusted EBITDA
-    ws.cell(row=row, column=1, value="Adjusted EBITDA")
-    if "stock_compensation" in raw_row_map:
-        sbc_row = raw_row_map["stock_compensation"]
-        ws.cell(row=row, column=2, value=f"=B{ebitda_row}+B{sbc_row}")
-        ws.cell(row=row, column=3, value=f"=C{ebitda_row}+C{sbc_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=metrics.adjusted_ebitda)
-        ws.cell(row=row, column=3, value=metrics.adjusted_ebitda_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="EBITDA + Stock Compensation")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=3).number_format = '#,##0'
-    ws.cell(row=row, column=4).number_format = '#,##0'
-    adj_ebitda_row = row
-    row += 1
+    current_cell.number_format = spec.number_format
+    prior_cell.number_format = spec.number_format
+    delta_cell.number_format = spec.delta_format or spec.number_format
 
-    # Net Margin
-    ws.cell(row=row, column=1, value="Net Income Margin")
-    if "net_income" in raw_row_map and "revenue" in raw_row_map:
-        ni_row = raw_row_map["net_income"]
-        rev_row = raw_row_map["revenue"]
-        ws.cell(row=row, column=2, value=f"=B{ni_row}/B{rev_row}")
-        ws.cell(row=row, column=3, value=f"=C{ni_row}/C{rev_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=metrics.net_income_margin)
-        ws.cell(row=row, column=3, value=metrics.net_income_margin_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Net Income / Revenue")
-    ws.cell(row=row, column=2).number_format = '0.00%'
-    ws.cell(row=row, column=3).number_format = '0.00%'
-    ws.cell(row=row, column=4).number_format = '0.00%'
-    row += 1
+    ws.append([spec.label, current_cell, prior_cell, delta_cell, spec.description])
 
-    # Tangible Net Worth
-    ws.cell(row=row, column=1, value="Tangible Net Worth")
-    if all(k in raw_row_map for k in ["stockholders_equity", "intangible_assets", "goodwill"]):
-        se_row = raw_row_map["stockholders_equity"]
-        ia_row = raw_row_map["intangible_assets"]
-        gw_row = raw_row_map["goodwill"]
-        ws.cell(row=row, column=2, value=f"=B{se_row}-B{ia_row}-B{gw_row}")
-        ws.cell(row=row, column=3, value=f"=C{se_row}-C{ia_row}-C{gw_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=metrics.tangible_net_worth)
-        ws.cell(row=row, column=3, value=metrics.tangible_net_worth_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Equity - Intangibles - Goodwill")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=3).number_format = '#,##0'
-    ws.cell(row=row, column=4).number_format = '#,##0'
-
-    # Auto-fit columns
+
+def _create_metrics_sheet(wb: Workbook, session: ExtractionSession, metrics: FinancialMetrics):
+    """Create the Calculated Metrics sheet with Excel formulas."""
+    ws = wb.create_sheet("Calculated Metrics")
+
+    # Column widths must be set before the first row is written
     ws.column_dimensions['A'].width = 25
     ws.column_dimensions['B'].width = 18
     ws.column_dimensions['C'].width = 18
     ws.column_dimensions['D'].width = 18
     ws.column_dimensions['E'].width = 35
 
+    # Headers
+    headers = ["Metric", "Current", "Prior", "YoY Delta", "Formula"]
+    ws.append(_header_row(ws, headers))
+    ws.append([])
+
+    # Raw values section
+    ws.append([_section_label(ws, "RAW VALUES (from XBRL)")])
+
+    # Raw values start on row 4; map each to its row number for formulas
+    present = _present_raw_values(session, METRICS_RAW_KEYS)
+    raw_row_map = {key: row for row, (key, _) in enumerate(present, start=4)}
+    for row, (_, ev) in enumerate(present, start=4):
+        ws.append(_raw_value_row(ws, row, ev, "Raw value from SEC filing"))
+    row = 4 + len(present)
+
+    # Calculated metrics section
+    ws.append([])
+    ws.append([_section_label(ws, "CALCULATED METRICS")])
+    row += 2
+
+    for spec in METRIC_ROWS:
+        _emit_metric_row(ws, row, raw_row_map, metrics, spec)
+        row += 1
+
 
 def _create_ratios_sheet(
     wb: Workbook,
@@ -382,242 +536,52 @@ def _create_ratios_sheet(
     """Create the Ratios sheet with Excel formulas."""
     ws = wb.create_sheet("Ratios")
 
-    # Create a mapping of raw values to row numbers
-    raw_row_map = {}
+    # Column widths must be set before the first row is written
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 18
+    ws.column_dimensions['C'].width = 18
+    ws.column_dimensions['D'].width = 18
+    ws.column_dimensions['E'].width = 40
 
     # Headers
     headers = ["Ratio", "Current", "Prior", "YoY Delta", "Formula"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        _apply_header_style(cell)
+    ws.append(_header_row(ws, headers))
+    ws.append([])
 
     # Raw values needed for ratios
-    ws.cell(row=3, column=1, value="RAW VALUES (from XBRL)").font = Font(bold=True, color="1F4E79")
-
-    row = 4
-    raw_metrics = ["current_assets", "current_liabilities", "cash", "total_debt",
-                   "stockholders_equity", "interest_expense", "accounts_receivable",
-                   "revenue", "net_income", "total_assets"]
-
-    for metric_key in raw_metrics:
-        if metric_key in session.raw_values:
-            ev = session.raw_values[metric_key]
-            raw_row_map[metric_key] = row
-            ws.cell(row=row, column=1, value=ev.display_name)
-            ws.cell(row=row, column=2, value=ev.value)
-            ws.cell(row=row, column=3, value=ev.value_prior)
-            ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-            _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-
-            ws.cell(row=row, column=2).number_format = '#,##0'
-            ws.cell(row=row, column=3).number_format = '#,##0'
-            ws.cell(row=row, column=4).number_format = '#,##0'
+    ws.append([_section_label(ws, "RAW VALUES (from XBRL)")])
 
-            row += 1
+    # Raw values start on row 4; map each to its row number for formulas
+    present = _present_raw_values(session, RATIOS_RAW_KEYS)
+    raw_row_map = {key: row for row, (key, _) in enumerate(present, start=4)}
+    for row, (_, ev) in enumerate(present, start=4):
+        ws.append(_raw_value_row(ws, row, ev))
+    row = 4 + len(present)
 
     # Add EBITDA from metrics calculation
-    ws.cell(row=row, column=1, value="EBITDA (calculated)")
-    ws.cell(row=row, column=2, value=metrics.ebitda)
-    ws.cell(row=row, column=3, value=metrics.ebitda_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=3).number_format = '#,##0'
-    ws.cell(row=row, column=4).number_format = '#,##0'
-    ebitda_row = row
+    ebitda_delta = WriteOnlyCell(ws, value=_delta_formula(row))
+    ebitda_delta.number_format = FMT_INT
+    ws.append([
+        "EBITDA (calculated)",
+        _number_cell(ws, metrics.ebitda),
+        _number_cell(ws, metrics.ebitda_prior),
+        ebitda_delta,
+    ])
+    raw_row_map["ebitda"] = row
     row += 1
 
     # Calculated ratios section
-    row += 1
-    ws.cell(row=row, column=1, value="CALCULATED RATIOS").font = Font(bold=True, color="1F4E79")
-    row += 1
-
-    # Current Ratio
-    ws.cell(row=row, column=1, value="Current Ratio")
-    if "current_assets" in raw_row_map and "current_liabilities" in raw_row_map:
-        ca_row = raw_row_map["current_assets"]
-        cl_row = raw_row_map["current_liabilities"]
-        ws.cell(row=row, column=2, value=f"=B{ca_row}/B{cl_row}")
-        ws.cell(row=row, column=3, value=f"=C{ca_row}/C{cl_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.current_ratio)
-        ws.cell(row=row, column=3, value=ratios.current_ratio_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Current Assets / Current Liabilities")
-    ws.cell(row=row, column=2).number_format = '0.00'
-    ws.cell(row=row, column=3).number_format = '0.00'
-    ws.cell(row=row, column=4).number_format = '+0.00;-0.00'
-    row += 1
-
-    # Cash Ratio
-    ws.cell(row=row, column=1, value="Cash Ratio")
-    if "cash" in raw_row_map and "current_liabilities" in raw_row_map:
-        cash_row = raw_row_map["cash"]
-        cl_row = raw_row_map["current_liabilities"]
-        ws.cell(row=row, column=2, value=f"=B{cash_row}/B{cl_row}")
-        ws.cell(row=row, column=3, value=f"=C{cash_row}/C{cl_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.cash_ratio)
-        ws.cell(row=row, column=3, value=ratios.cash_ratio_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Cash / Current Liabilities")
-    ws.cell(row=row, column=2).number_format = '0.00'
-    ws.cell(row=row, column=3).number_format = '0.00'
-    ws.cell(row=row, column=4).number_format = '+0.00;-0.00'
-    row += 1
-
-    # Debt-to-Equity
-    ws.cell(row=row, column=1, value="Debt-to-Equity")
-    if "total_debt" in raw_row_map and "stockholders_equity" in raw_row_map:
-        td_row = raw_row_map["total_debt"]
-        se_row = raw_row_map["stockholders_equity"]
-        ws.cell(row=row, column=2, value=f"=B{td_row}/B{se_row}")
-        ws.cell(row=row, column=3, value=f"=C{td_row}/C{se_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.debt_to_equity)
-        ws.cell(row=row, column=3, value=ratios.debt_to_equity_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Total Debt / Stockholders' Equity")
-    ws.cell(row=row, column=2).number_format = '0.00'
-    ws.cell(row=row, column=3).number_format = '0.00'
-    ws.cell(row=row, column=4).number_format = '+0.00;-0.00'
-    row += 1
-
-    # EBITDA Interest Coverage
-    ws.cell(row=row, column=1, value="EBITDA Interest Coverage")
-    if "interest_expense" in raw_row_map:
-        ie_row = raw_row_map["interest_expense"]
-        ws.cell(row=row, column=2, value=f"=B{ebitda_row}/B{ie_row}")
-        ws.cell(row=row, column=3, value=f"=C{ebitda_row}/C{ie_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.ebitda_interest_coverage)
-        ws.cell(row=row, column=3, value=ratios.ebitda_interest_coverage_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="EBITDA / Interest Expense")
-    ws.cell(row=row, column=2).number_format = '0.00'
-    ws.cell(row=row, column=3).number_format = '0.00'
-    ws.cell(row=row, column=4).number_format = '+0.00;-0.00'
-    row += 1
-
-    # Net Debt / EBITDA
-    ws.cell(row=row, column=1, value="Net Debt / EBITDA")
-    if "total_debt" in raw_row_map and "cash" in raw_row_map:
-        td_row = raw_row_map["total_debt"]
-        cash_row = raw_row_map["cash"]
-        ws.cell(row=row, column=2, value=f"=(B{td_row}-B{cash_row})/B{ebitda_row}")
-        ws.cell(row=row, column=3, value=f"=(C{td_row}-C{cash_row})/C{ebitda_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.net_debt_to_ebitda)
-        ws.cell(row=row, column=3, value=ratios.net_debt_to_ebitda_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="(Total Debt - Cash) / EBITDA")
-    ws.cell(row=row, column=2).number_format = '0.00'
-    ws.cell(row=row, column=3).number_format = '0.00'
-    ws.cell(row=row, column=4).number_format = '+0.00;-0.00'
-    row += 1
-
-    # Days Sales Outstanding
-    ws.cell(row=row, column=1, value="Days Sales Outstanding")
-    if "accounts_receivable" in raw_row_map and "revenue" in raw_row_map:
-        ar_row = raw_row_map["accounts_receivable"]
-        rev_row = raw_row_map["revenue"]
-        ws.cell(row=row, column=2, value=f"=(B{ar_row}/B{rev_row})*365")
-        ws.cell(row=row, column=3, value=f"=(C{ar_row}/C{rev_row})*365")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.days_sales_outstanding)
-        ws.cell(row=row, column=3, value=ratios.days_sales_outstanding_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="(A/R / Revenue) × 365")
-    ws.cell(row=row, column=2).number_format = '0.0'
-    ws.cell(row=row, column=3).number_format = '0.0'
-    ws.cell(row=row, column=4).number_format = '+0.0;-0.0'
-    row += 1
-
-    # Working Capital
-    ws.cell(row=row, column=1, value="Working Capital")
-    if "current_assets" in raw_row_map and "current_liabilities" in raw_row_map:
-        ca_row = raw_row_map["current_assets"]
-        cl_row = raw_row_map["current_liabilities"]
-        ws.cell(row=row, column=2, value=f"=B{ca_row}-B{cl_row}")
-        ws.cell(row=row, column=3, value=f"=C{ca_row}-C{cl_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.working_capital)
-        ws.cell(row=row, column=3, value=ratios.working_capital_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Current Assets - Current Liabilities")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=3).number_format = '#,##0'
-    ws.cell(row=row, column=4).number_format = '#,##0'
-    row += 1
-
-    # Return on Assets
-    ws.cell(row=row, column=1, value="Return on Assets")
-    if "net_income" in raw_row_map and "total_assets" in raw_row_map:
-        ni_row = raw_row_map["net_income"]
-        ta_row = raw_row_map["total_assets"]
-        ws.cell(row=row, column=2, value=f"=B{ni_row}/B{ta_row}")
-        ws.cell(row=row, column=3, value=f"=C{ni_row}/C{ta_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.return_on_assets)
-        ws.cell(row=row, column=3, value=ratios.return_on_assets_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Net Income / Total Assets")
-    ws.cell(row=row, column=2).number_format = '0.00%'
-    ws.cell(row=row, column=3).number_format = '0.00%'
-    ws.cell(row=row, column=4).number_format = '+0.00%;-0.00%'
-    row += 1
+    ws.append([])
+    ws.append([_section_label(ws, "CALCULATED RATIOS")])
+    row += 2
 
-    # Return on Equity
-    ws.cell(row=row, column=1, value="Return on Equity")
-    if "net_income" in raw_row_map and "stockholders_equity" in raw_row_map:
-        ni_row = raw_row_map["net_income"]
-        se_row = raw_row_map["stockholders_equity"]
-        ws.cell(row=row, column=2, value=f"=B{ni_row}/B{se_row}")
-        ws.cell(row=row, column=3, value=f"=C{ni_row}/C{se_row}")
-        _apply_data_style(ws.cell(row=row, column=2), is_formula=True)
-        _apply_data_style(ws.cell(row=row, column=3), is_formula=True)
-    else:
-        ws.cell(row=row, column=2, value=ratios.return_on_equity)
-        ws.cell(row=row, column=3, value=ratios.return_on_equity_prior)
-    ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-    _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-    ws.cell(row=row, column=5, value="Net Income / Stockholders' Equity")
-    ws.cell(row=row, column=2).number_format = '0.00%'
-    ws.cell(row=row, column=3).number_format = '0.00%'
-    ws.cell(row=row, column=4).number_format = '+0.00%;-0.00%'
-
-    # Auto-fit columns
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 18
-    ws.column_dimensions['C'].width = 18
-    ws.column_dimensions['D'].width = 18
-    ws.column_dimensions['E'].width = 40
+    for spec in RATIO_ROWS:
+        _emit_metric_row(ws, row, raw_row_map, ratios, spec)
+        row += 1
 
 
-SECTION_FILL = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
+SECTION_FILL = PatternFill(start_color=LIGHT_BLUE, end_color=LIGHT_BLUE, fill_type="solid")
+SECTION_HEADER_FONT = Font(bold=True, color=DARK_BLUE, size=10)
 SUBTOTAL_FONT = Font(bold=True)
 SUBTOTAL_BORDER = Border(
     left=Side(style='thin'),
@@ -627,137 +591,98 @@ SUBTOTAL_BORDER = Border(
 )
 
 
+def _statement_sheet_rows(items: tuple) -> tuple:
+    """(metric_key, section, indented label, is_bold, border) per statement line item."""
+    return tuple(
+        (
+            item.metric_key,
+            item.section,
+            ("    " if item.indent_level > 0 else "") + item.display_name,
+            item.is_bold,
+            SUBTOTAL_BORDER if item.is_bold and item.is_subtotal else THIN_BORDER,
+        )
+        for item in items
+    )
+
+
+# Statement sheet rows; the line item registries are static, so each item's
+# render attributes are resolved once here rather than per export
+INCOME_STATEMENT_SHEET_ROWS = _statement_sheet_rows(INCOME_STATEMENT_ITEMS)
+BALANCE_SHEET_SHEET_ROWS = _statement_sheet_rows(BALANCE_SHEET_ITEMS)
+CASH_FLOW_SHEET_ROWS = _statement_sheet_rows(CASH_FLOW_ITEMS)
+
+
 def _create_statement_sheet(
     wb: Workbook,
     session: ExtractionSession,
     sheet_name: str,
-    items: list,
+    rows: tuple,
 ):
-    """Create a financial statement sheet (Income Statement, Balance Sheet, or Cash Flow)."""
+    """
+    Create a financial statement sheet (Income Statement, Balance Sheet, or Cash Flow).
+
+    rows are _statement_sheet_rows() tuples, e.g. INCOME_STATEMENT_SHEET_ROWS.
+    """
     ws = wb.create_sheet(sheet_name)
 
+    # Column widths must be set before the first row is written
+    ws.column_dimensions['A'].width = 35
+    ws.column_dimensions['B'].width = 18
+    ws.column_dimensions['C'].width = 18
+    ws.column_dimensions['D'].width = 18
+
     # Headers
     headers = ["Item", "Current Year", "Prior Year", "YoY Delta"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        _apply_header_style(cell)
+    ws.append(_header_row(ws, headers))
 
     row = 2
     last_section = ""
-    raw_row_map = {}  # metric_key -> row number for formulas
 
-    for item in items:
-        if item.metric_key not in session.raw_values:
+    raw_values = session.raw_values
+    for metric_key, section, label, is_bold, border in rows:
+        ev = raw_values.get(metric_key)
+        if ev is None:
             continue
 
         # Section header
-        if item.section and item.section != last_section:
-            last_section = item.section
-            section_cell = ws.cell(row=row, column=1, value=item.section.upper())
-            section_cell.font = Font(bold=True, color="1F4E79", size=10)
-            section_cell.fill = SECTION_FILL
-            for col in range(2, 5):
-                ws.cell(row=row, column=col).fill = SECTION_FILL
+        if section and section != last_section:
+            last_section = section
+            section_cells = [WriteOnlyCell(ws, value=section.upper())]
+            section_cells[0].font = SECTION_HEADER_FONT
+            section_cells += [WriteOnlyCell(ws) for _ in range(3)]
+            for cell in section_cells:
+                cell.fill = SECTION_FILL
+            ws.append(section_cells)
             row += 1
-        elif not item.section and last_section:
+        elif not section and last_section:
             last_section = ""
 
-        ev = session.raw_values[item.metric_key]
-        raw_row_map[item.metric_key] = row
-
-        # Label with indent
-        label = ("    " if item.indent_level > 0 else "") + item.display_name
-        ws.cell(row=row, column=1, value=label)
-
-        # Values
-        ws.cell(row=row, column=2, value=ev.value)
-        ws.cell(row=row, column=3, value=ev.value_prior)
-
-        # Delta formula
-        ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
-        _apply_data_style(ws.cell(row=row, column=4), is_formula=True)
-
-        # Number formats
-        ws.cell(row=row, column=2).number_format = '#,##0'
-        ws.cell(row=row, column=3).number_format = '#,##0'
-        ws.cell(row=row, column=4).number_format = '#,##0'
-
-        # Bold + border for subtotal rows
-        if item.is_bold:
-            for col in range(1, 5):
-                cell = ws.cell(row=row, column=col)
+        delta = WriteOnlyCell(ws, value=_delta_formula(row))
+        _apply_data_style(delta, is_formula=True)
+        cells = [
+            WriteOnlyCell(ws, value=label),
+            WriteOnlyCell(ws, value=ev.value),
+            WriteOnlyCell(ws, value=ev.value_prior),
+            delta,
+        ]
+
+        # Single pass over the row: number format, bold + border for subtotal rows
+        for cell in cells:
+            cell.border = border
+            if is_bold:
                 cell.font = SUBTOTAL_FONT
-                if item.is_subtotal:
-                    cell.border = SUBTOTAL_BORDER
-
-        # Apply cell borders
-        for col in range(1, 5):
-            ws.cell(row=row, column=col).border = THIN_BORDER
+        for cell in cells[1:]:
+            cell.number_format = FMT_INT
 
+        ws.append(cells)
         row += 1
 
-    # Auto-fit columns
-    ws.column_dimensions['A'].width = 35
-    ws.column_dimensions['B'].width = 18
-    ws.column_dimensions['C'].width = 18
-    ws.column_dimensions['D'].width = 18
-
 
 def _create_verification_sheet(wb: Workbook, verification: VerificationResult):
     """Create the Verification sheet showing all checks with pass/fail."""
     ws = wb.create_sheet("Verification")
 
-    # Summary at top
-    ws.cell(row=1, column=1, value="Verification Summary")
-    ws.cell(row=1, column=1).font = Font(bold=True, size=12, color="1F4E79")
-
-    ws.cell(row=2, column=1, value=f"Passed: {verification.pass_count}")
-    ws.cell(row=2, column=1).font = Font(color="006100")
-    ws.cell(row=2, column=2, value=f"Failed: {verification.fail_count}")
-    ws.cell(row=2, column=2).font = Font(color="9C0006")
-    ws.cell(row=2, column=3, value=f"Skipped: {verification.skip_count}")
-    ws.cell(row=2, column=3).font = Font(color="808080")
-
-    # Headers
-    headers = ["Check", "Year", "Formula", "LHS Value", "RHS Value", "Difference", "Tolerance", "Result", "Severity"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=4, column=col, value=header)
-        _apply_header_style(cell)
-
-    # Data rows
-    for idx, check in enumerate(verification.checks, 5):
-        ws.cell(row=idx, column=1, value=check.description)
-        ws.cell(row=idx, column=2, value=check.year)
-        ws.cell(row=idx, column=3, value=check.formula)
-        ws.cell(row=idx, column=4, value=check.lhs_value)
-        ws.cell(row=idx, column=5, value=check.rhs_value)
-        ws.cell(row=idx, column=6, value=check.difference)
-        ws.cell(row=idx, column=7, value=f"{check.tolerance * 100:.1f}%")
-
-        result_text = "SKIP" if check.skipped else ("PASS" if check.passed else "FAIL")
-        result_cell = ws.cell(row=idx, column=8, value=result_text)
-
-        if check.skipped:
-            result_cell.font = Font(color="808080")
-        elif check.passed:
-            result_cell.font = Font(color="006100", bold=True)
-            result_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        else:
-            result_cell.font = Font(color="9C0006", bold=True)
-            result_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-        ws.cell(row=idx, column=9, value=check.severity.upper())
-
-        # Number formats
-        ws.cell(row=idx, column=4).number_format = '#,##0'
-        ws.cell(row=idx, column=5).number_format = '#,##0'
-        ws.cell(row=idx, column=6).number_format = '#,##0'
-
-        # Borders
-        for col in range(1, 10):
-            ws.cell(row=idx, column=col).border = THIN_BORDER
-
-    # Auto-fit columns
+    # Column widths must be set before the first row is written
     ws.column_dimensions['A'].width = 25
     ws.column_dimensions['B'].width = 10
     ws.column_dimensions['C'].width = 50
@@ -768,40 +693,81 @@ def _create_verification_sheet(wb: Workbook, verification: VerificationResult):
     ws.column_dimensions['H'].width = 10
     ws.column_dimensions['I'].width = 10
 
-
-def _create_audit_sheet(wb: Workbook, calculation_steps: list[CalculationStep]):
-    """Create the Audit Log sheet with calculation steps."""
-    ws = wb.create_sheet("Audit Log")
-
-    # Add note at top
-    ws.cell(row=1, column=1, value="Note: This sheet documents the calculation logic. Actual working formulas are in the 'Calculated Metrics' and 'Ratios' sheets.")
-    ws.cell(row=1, column=1).font = Font(italic=True, color="666666")
-    ws.merge_cells('A1:E1')
+    # Summary at top
+    title_cell = WriteOnlyCell(ws, value="Verification Summary")
+    title_cell.font = TITLE_FONT
+    ws.append([title_cell])
+
+    passed_cell = WriteOnlyCell(ws, value=f"Passed: {verification.pass_count}")
+    passed_cell.font = SUMMARY_PASS_FONT
+    failed_cell = WriteOnlyCell(ws, value=f"Failed: {verification.fail_count}")
+    failed_cell.font = SUMMARY_FAIL_FONT
+    skipped_cell = WriteOnlyCell(ws, value=f"Skipped: {verification.skip_count}")
+    skipped_cell.font = SUMMARY_SKIP_FONT
+    ws.append([passed_cell, failed_cell, skipped_cell])
+    ws.append([])
 
     # Headers
-    headers = ["Metric", "Formula Description", "Inputs Used", "Result"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=3, column=col, value=header)
-        _apply_header_style(cell)
+    headers = ["Check", "Year", "Formula", "LHS Value", "RHS Value", "Difference", "Tolerance", "Result", "Severity"]
+    ws.append(_header_row(ws, headers))
 
     # Data rows
-    for row_idx, step in enumerate(calculation_steps, 4):
-        ws.cell(row=row_idx, column=1, value=step.metric)
-        ws.cell(row=row_idx, column=2, value=step.formula)
-
-        # Format inputs as readable string
-        inputs_str = ", ".join([f"{k}={v:,.0f}" for k, v in step.inputs.items()])
-        ws.cell(row=row_idx, column=3, value=inputs_str)
+    for check in verification.checks:
+        result_text = "SKIP" if check.skipped else ("PASS" if check.passed else "FAIL")
+        result_cell = _styled_cell(ws, result_text, "bordered")
+        if check.skipped:
+            result_cell.font = SKIP_FONT
+        elif check.passed:
+            result_cell.font = PASS_FONT
+            result_cell.fill = PASS_FILL
+        else:
+            result_cell.font = FAIL_FONT
+            result_cell.fill = FAIL_FILL
+
+        ws.append([
+            _styled_cell(ws, check.description, "bordered"),
+            _styled_cell(ws, check.year, "bordered"),
+            _styled_cell(ws, check.formula, "bordered"),
+            _styled_cell(ws, check.lhs_value, "bordered_int"),
+            _styled_cell(ws, check.rhs_value, "bordered_int"),
+            _styled_cell(ws, check.difference, "bordered_int"),
+            _styled_cell(ws, f"{check.tolerance * 100:.1f}%", "bordered"),
+            result_cell,
+            _styled_cell(ws, check.severity.upper(), "bordered"),
+        ])
 
-        ws.cell(row=row_idx, column=4, value=step.result)
-        ws.cell(row=row_idx, column=4).number_format = '#,##0.00'
 
-        # Apply styles
-        for col in range(1, 5):
-            ws.cell(row=row_idx, column=col).border = THIN_BORDER
+def _create_audit_sheet(wb: Workbook, calculation_steps: list[CalculationStep]):
+    """Create the Audit Log sheet with calculation steps."""
+    ws = wb.create_sheet("Audit Log")
 
-    # Auto-fit columns
+    # Column widths must be set before the first row is written
     ws.column_dimensions['A'].width = 25
     ws.column_dimensions['B'].width = 55
     ws.column_dimensions['C'].width = 70
     ws.column_dimensions['D'].width = 20
+
+    # Add note at top; no merge needed, the text overflows into the empty cells to its right
+    note_cell = WriteOnlyCell(ws, value="Note: This sheet documents the calculation logic. Actual working formulas are in the 'Calculated Metrics' and 'Ratios' sheets.")
+    note_cell.font = AUDIT_NOTE_FONT
+    ws.append([note_cell])
+    ws.append([])
+
+    # Headers
+    headers = ["Metric", "Formula Description", "Inputs Used", "Result"]
+    ws.append(_header_row(ws, headers))
+
+    # Data rows
+    for metric, formula, inputs_str, result in map(_audit_row, calculation_steps):
+        ws.append([
+            _styled_cell(ws, metric, "bordered"),
+            _styled_cell(ws, formula, "bordered"),
+            _styled_cell(ws, inputs_str, "bordered"),
+            _styled_cell(ws, result, "bordered_decimal"),
+        ])
+
+
+def _audit_row(step: CalculationStep) -> tuple:
+    """Audit Log row values for one step, with inputs formatted as a readable string."""
+    inputs_str = ", ".join([f"{k}={v:,.0f}" for k, v in step.inputs.items()])
+    return step.metric, step.formula, inputs_str, step.result
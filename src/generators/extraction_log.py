@@ -5,37 +5,132 @@ from datetime import datetime
 from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
 
 from src.calculators.metrics import FinancialMetrics
 from src.calculators.ratios import FinancialRatios
+from src.generators.formatting import format_currency_short
+
+# strftime format for the "Generated:" line
+GENERATED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def format_currency(value: float) -> str:
     """Format a currency value."""
     if value == 0:
         return "-"
-    abs_val = abs(value)
-    if abs_val >= 1e9:
-        formatted = f"${abs_val / 1e9:,.2f} B"
-    elif abs_val >= 1e6:
-        formatted = f"${abs_val / 1e6:,.2f} M"
-    else:
-        formatted = f"${abs_val:,.0f}"
-    return f"-{formatted}" if value < 0 else formatted
+    return format_currency_short(value, suffix_sep=" ")
 
 
 def format_percentage(value: float) -> str:
     """Format a decimal as percentage."""
     if value == 0:
         return "-"
-    return f"{value * 100:.2f}%"
+    return "%.2f%%" % (value * 100.0)
 
 
 def format_ratio(value: float) -> str:
     """Format a ratio value."""
     if value == 0:
         return "-"
-    return f"{value:.2f}x"
+    return "%.2fx" % value
+
+
+# (label, FinancialMetrics / FinancialRatios attribute, display kind) per table
+# row; the prior-year value is read from attribute + "_prior"
+METRICS_SCHEMA = (
+    ("Tangible Net Worth", "tangible_net_worth", "currency"),
+    ("Cash Balance", "cash_balance", "currency"),
+    ("Top Line Revenue", "top_line_revenue", "currency"),
+    ("Gross Profit", "gross_profit", "currency"),
+    ("Gross Profit Margin", "gross_profit_margin", "percentage"),
+    ("Operating Income", "operating_income", "currency"),
+    ("Operating Income Margin", "operating_income_margin", "percentage"),
+    ("EBITDA", "ebitda", "currency"),
+    ("EBITDA Margin", "ebitda_margin", "percentage"),
+    ("Adjusted EBITDA", "adjusted_ebitda", "currency"),
+    ("Adj. EBITDA Margin", "adjusted_ebitda_margin", "percentage"),
+    ("Net Income", "net_income", "currency"),
+    ("Net Income Margin", "net_income_margin", "percentage"),
+)
+
+RATIOS_SCHEMA = (
+    ("Current Ratio", "current_ratio", "ratio"),
+    ("Cash Ratio", "cash_ratio", "ratio"),
+    ("Debt-to-Equity", "debt_to_equity", "ratio"),
+    ("EBITDA Interest Coverage", "ebitda_interest_coverage", "ratio"),
+    ("Net Debt / EBITDA", "net_debt_to_ebitda", "ratio"),
+    ("Net Debt / Adj. EBITDA", "net_debt_to_adj_ebitda", "ratio"),
+    ("Days Sales Outstanding", "days_sales_outstanding", "days"),
+    ("Working Capital", "working_capital", "currency"),
+    ("Return on Assets", "return_on_assets", "ratio"),
+    ("Return on Equity", "return_on_equity", "ratio"),
+)
+
+
+def _format_days(value: float) -> str:
+    """Format a day count."""
+    return "%.1f" % value if value else "-"
+
+
+def _format_percentage_delta(delta: float) -> str:
+    """Format a change in a decimal percentage as signed percentage points."""
+    return "%+.2f%%" % (delta * 100.0)
+
+
+# Schema kind -> (value formatter, delta formatter); an unchanged value leaves
+# the delta cell blank. Simple float formats use %-formatting, which is cheaper
+# than f-strings / str.format for a single float
+KIND_FORMATTERS = {
+    "currency": (format_currency, format_currency),
+    "percentage": (format_percentage, _format_percentage_delta),
+    "ratio": (format_ratio, "%+.2fx".__mod__),
+    "days": (_format_days, "%+.1f".__mod__),
+}
+
+
+def _format_values(kind: str, current: float, prior: float) -> tuple[str, str, str]:
+    """Format (current, prior, delta) cell text for a schema row of the given kind."""
+    format_value, format_delta = KIND_FORMATTERS[kind]
+    delta = current - prior
+    return (
+        format_value(current),
+        format_value(prior),
+        format_delta(delta) if delta != 0 else "",
+    )
+
+
+def _add_header_row(table, labels) -> None:
+    """Write bold header labels into the table's first row, one run per cell."""
+    for cell, label in zip(table.rows[0].cells, labels):
+        cell.paragraphs[0].add_run(label).bold = True
+
+
+def _append_rows(table, rows) -> None:
+    """
+    Append rows of plain cell text to a table.
+
+    Builds the <w:tr>/<w:tc> elements directly instead of going through
+    table.add_row() and cell.text, which parse a fresh cell per column and
+    re-walk the table grid on every cell access.
+    """
+    tbl = table._tbl
+    widths = [grid_col.w for grid_col in tbl.tblGrid.gridCol_lst]
+    for values in rows:
+        tr = OxmlElement("w:tr")
+        for text, width in zip(values, widths):
+            tc = OxmlElement("w:tc")
+            if width is not None:
+                tc.width = width
+            # A cell needs a paragraph, but blank cells don't need a run
+            p = OxmlElement("w:p")
+            if text:
+                r = OxmlElement("w:r")
+                r.text = text
+                p.append(r)
+            tc.append(p)
+            tr.append(tc)
+        tbl.append(tr)
 
 
 def generate_extraction_log(
@@ -48,11 +143,14 @@ def generate_extraction_log(
     ratios: FinancialRatios,
     notes: list[str],
     warnings: list[str],
+    generated_at: str | None = None,
 ) -> Path:
     """
     Generate a Word document with extraction notes, warnings, and raw data.
 
     This serves as an audit trail for the financial data extraction process.
+    generated_at is the pre-formatted "Generated:" timestamp; callers producing
+    several documents in one run pass a shared value (defaults to now).
     """
     doc = Document()
 
@@ -61,7 +159,7 @@ def generate_extraction_log(
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Metadata
-    doc.add_paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    doc.add_paragraph(f"Generated: {generated_at or datetime.now().strftime(GENERATED_AT_FORMAT)}")
     doc.add_paragraph(f"Fiscal Year End: {fiscal_year_end}")
     doc.add_paragraph(f"Prior Year End: {fiscal_year_end_prior}")
 
@@ -83,104 +181,36 @@ def generate_extraction_log(
     else:
         doc.add_paragraph("No extraction notes.")
 
+    # Both data tables share the "Table Grid" style; look it up once
+    table_style = doc.styles["Table Grid"]
+
     # Raw Extracted Values - Metrics
     doc.add_heading("Extracted Financial Metrics", level=1)
 
-    metrics_table = doc.add_table(rows=1, cols=4)
-    metrics_table.style = "Table Grid"
+    metrics_table = doc.add_table(rows=1, cols=4, style=table_style)
 
     # Header
-    header_cells = metrics_table.rows[0].cells
-    header_cells[0].text = "Metric"
-    header_cells[1].text = "Current Value"
-    header_cells[2].text = "Prior Value"
-    header_cells[3].text = "Delta"
-    for cell in header_cells:
-        cell.paragraphs[0].runs[0].font.bold = True
-
-    # Metrics data
-    metrics_data = [
-        ("Tangible Net Worth", metrics.tangible_net_worth, metrics.tangible_net_worth_prior, True),
-        ("Cash Balance", metrics.cash_balance, metrics.cash_balance_prior, True),
-        ("Top Line Revenue", metrics.top_line_revenue, metrics.top_line_revenue_prior, True),
-        ("Gross Profit", metrics.gross_profit, metrics.gross_profit_prior, True),
-        ("Gross Profit Margin", metrics.gross_profit_margin, metrics.gross_profit_margin_prior, False),
-        ("Operating Income", metrics.operating_income, metrics.operating_income_prior, True),
-        ("Operating Income Margin", metrics.operating_income_margin, metrics.operating_income_margin_prior, False),
-        ("EBITDA", metrics.ebitda, metrics.ebitda_prior, True),
-        ("EBITDA Margin", metrics.ebitda_margin, metrics.ebitda_margin_prior, False),
-        ("Adjusted EBITDA", metrics.adjusted_ebitda, metrics.adjusted_ebitda_prior, True),
-        ("Adj. EBITDA Margin", metrics.adjusted_ebitda_margin, metrics.adjusted_ebitda_margin_prior, False),
-        ("Net Income", metrics.net_income, metrics.net_income_prior, True),
-        ("Net Income Margin", metrics.net_income_margin, metrics.net_income_margin_prior, False),
-    ]
-
-    for label, current, prior, is_currency in metrics_data:
-        row = metrics_table.add_row()
-        cells = row.cells
-        cells[0].text = label
-
-        if is_currency:
-            cells[1].text = format_currency(current)
-            cells[2].text = format_currency(prior)
-            delta = current - prior
-            cells[3].text = format_currency(delta) if delta != 0 else "-"
-        else:
-            cells[1].text = format_percentage(current)
-            cells[2].text = format_percentage(prior)
-            delta = current - prior
-            cells[3].text = f"{delta * 100:+.2f}%" if delta != 0 else "-"
+    _add_header_row(metrics_table, ("Metric", "Current Value", "Prior Value", "Delta"))
+
+    _append_rows(metrics_table, (
+        (label, *_format_values(kind, getattr(metrics, attr), getattr(metrics, f"{attr}_prior")))
+        for label, attr, kind in METRICS_SCHEMA
+    ))
 
     doc.add_paragraph()
 
     # Raw Extracted Values - Ratios
     doc.add_heading("Extracted Financial Ratios", level=1)
 
-    ratios_table = doc.add_table(rows=1, cols=4)
-    ratios_table.style = "Table Grid"
+    ratios_table = doc.add_table(rows=1, cols=4, style=table_style)
 
     # Header
-    header_cells = ratios_table.rows[0].cells
-    header_cells[0].text = "Ratio"
-    header_cells[1].text = "Current Value"
-    header_cells[2].text = "Prior Value"
-    header_cells[3].text = "Delta"
-    for cell in header_cells:
-        cell.paragraphs[0].runs[0].font.bold = True
-
-    ratios_data = [
-        ("Current Ratio", ratios.current_ratio, ratios.current_ratio_prior, False),
-        ("Cash Ratio", ratios.cash_ratio, ratios.cash_ratio_prior, False),
-        ("Debt-to-Equity", ratios.debt_to_equity, ratios.debt_to_equity_prior, False),
-        ("EBITDA Interest Coverage", ratios.ebitda_interest_coverage, ratios.ebitda_interest_coverage_prior, False),
-        ("Net Debt / EBITDA", ratios.net_debt_to_ebitda, ratios.net_debt_to_ebitda_prior, False),
-        ("Net Debt / Adj. EBITDA", ratios.net_debt_to_adj_ebitda, ratios.net_debt_to_adj_ebitda_prior, False),
-        ("Days Sales Outstanding", ratios.days_sales_outstanding, ratios.days_sales_outstanding_prior, True),
-        ("Working Capital", ratios.working_capital, ratios.working_capital_prior, True),
-        ("Return on Assets", ratios.return_on_assets, ratios.return_on_assets_prior, False),
-        ("Return on Equity", ratios.return_on_equity, ratios.return_on_equity_prior, False),
-    ]
-
-    for label, current, prior, is_days_or_currency in ratios_data:
-        row = ratios_table.add_row()
-        cells = row.cells
-        cells[0].text = label
-
-        if "Working Capital" in label:
-            cells[1].text = format_currency(current)
-            cells[2].text = format_currency(prior)
-            delta = current - prior
-            cells[3].text = format_currency(delta) if delta != 0 else "-"
-        elif is_days_or_currency:
-            cells[1].text = f"{current:.1f}" if current else "-"
-            cells[2].text = f"{prior:.1f}" if prior else "-"
-            delta = current - prior
-            cells[3].text = f"{delta:+.1f}" if delta != 0 else "-"
-        else:
-            cells[1].text = format_ratio(current)
-            cells[2].text = format_ratio(prior)
-            delta = current - prior
-            cells[3].text = f"{delta:+.2f}x" if delta != 0 else "-"
+    _add_header_row(ratios_table, ("Ratio", "Current Value", "Prior Value", "Delta"))
+
+    _append_rows(ratios_table, (
+        (label, *_format_values(kind, getattr(ratios, attr), getattr(ratios, f"{attr}_prior")))
+        for label, attr, kind in RATIOS_SCHEMA
+    ))
 
     # Save
     output_path = Path(output_path)
@@ -0,0 +1,19 @@
+"""Number formatting shared by the report generators."""
+
+# (threshold, divisor, suffix), largest first
+_CURRENCY_BUCKETS = ((1e9, 1e9, "B"), (1e6, 1e6, "M"))
+
+
+def format_currency_short(value: float, decimals: int = 2, suffix_sep: str = "") -> str:
+    """
+    Format a currency value with a B/M suffix.
+
+    e.g. 1.234e9 -> "$1.23B", -4.56e7 -> "-$45.60M", 950000 -> "$950,000".
+    suffix_sep goes between the number and the suffix ("$1.23 B").
+    """
+    mag = abs(value)
+    sign = "-" if value < 0 else ""
+    for threshold, divisor, suffix in _CURRENCY_BUCKETS:
+        if mag >= threshold:
+            return f"{sign}${mag / divisor:,.{decimals}f}{suffix_sep}{suffix}"
+    return f"{sign}${mag:,.0f}"
@@ -1,11 +1,29 @@
 """LLM-based narrative generation for company reports."""
 
+import functools
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from anthropic import Anthropic
 
 from src.fetchers.yahoo import CompanyInfo, CorporateAction
 from src.calculators.metrics import FinancialMetrics
 from src.calculators.ratios import FinancialRatios
+from src.generators.formatting import format_currency_short
+
+# Shared Anthropic client (keeps its HTTP connection pool across calls)
+_CLIENT: Anthropic | None = None
+
+# Background narrative requests, so callers can overlap the LLM round trip
+# with other report work
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="narrative")
+
+
+def _get_client() -> Anthropic:
+    """Return the shared Anthropic client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+    return _CLIENT
 
 
 def generate_company_narrative(
@@ -26,7 +44,7 @@ def generate_company_narrative(
     Returns:
         Generated narrative text
     """
-    client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+    client = _get_client()
 
     # Build context for the prompt
     metrics_summary = _format_metrics_for_prompt(metrics)
@@ -70,24 +88,35 @@ Keep the tone professional and factual. Focus on the most important insights fro
     return message.content[0].text
 
 
+def submit_company_narrative(
+    company_info: CompanyInfo,
+    metrics: FinancialMetrics,
+    ratios: FinancialRatios,
+    corporate_actions: list[CorporateAction] | None = None,
+) -> Future[str]:
+    """
+    Start generate_company_narrative in the background.
+
+    Returns a Future; call .result() only when the narrative text is needed
+    (it re-raises any error from the LLM call).
+    """
+    return _EXECUTOR.submit(
+        generate_company_narrative, company_info, metrics, ratios, corporate_actions
+    )
+
+
 def _format_metrics_for_prompt(metrics: FinancialMetrics) -> str:
     """Format metrics for inclusion in prompt."""
     deltas = metrics.calculate_deltas()
-
-    def fmt_currency(val: float) -> str:
-        """Format a currency value with B/M suffix."""
-        if abs(val) >= 1e9:
-            return f"${val/1e9:,.1f}B"
-        elif abs(val) >= 1e6:
-            return f"${val/1e6:,.1f}M"
-        else:
-            return f"${val:,.0f}"
-
-    return f"""- Revenue: {fmt_currency(metrics.top_line_revenue)} (Delta: {fmt_currency(deltas['top_line_revenue_delta'])})
-- Gross Profit Margin: {metrics.gross_profit_margin:.1%} (Delta: {deltas['gross_profit_margin_delta']:.1%})
-- Operating Income Margin: {metrics.operating_income_margin:.1%} (Delta: {deltas['operating_income_margin_delta']:.1%})
-- EBITDA: {fmt_currency(metrics.ebitda)} (Delta: {fmt_currency(deltas['ebitda_delta'])})
-- Net Income: {fmt_currency(metrics.net_income)} (Delta: {fmt_currency(deltas['net_income_delta'])})"""
+    fmt_currency = functools.partial(format_currency_short, decimals=1)
+
+    return "\n".join((
+        f"- Revenue: {fmt_currency(metrics.top_line_revenue)} (Delta: {fmt_currency(deltas['top_line_revenue_delta'])})",
+        f"- Gross Profit Margin: {metrics.gross_profit_margin:.1%} (Delta: {deltas['gross_profit_margin_delta']:.1%})",
+        f"- Operating Income Margin: {metrics.operating_income_margin:.1%} (Delta: {deltas['operating_income_margin_delta']:.1%})",
+        f"- EBITDA: {fmt_currency(metrics.ebitda)} (Delta: {fmt_currency(deltas['ebitda_delta'])})",
+        f"- Net Income: {fmt_currency(metrics.net_income)} (Delta: {fmt_currency(deltas['net_income_delta'])})",
+    ))
 
 
 def _format_ratios_for_prompt(ratios: FinancialRatios) -> str:
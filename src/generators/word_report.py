@@ -1,13 +1,19 @@
 """Word document report generation."""
 
+import copy
+import functools
+import operator
+import os
 import re
 from pathlib import Path
+
+import numpy as np
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
+from docx.table import _Cell
 
 from src.calculators.metrics import FinancialMetrics
 from src.calculators.ratios import FinancialRatios
@@ -15,6 +21,7 @@ from src.calculators.verification import VerificationResult
 from src.fetchers.yahoo import CompanyInfo, CorporateAction
 from src.models.extraction import (
     ExtractionSession,
+    StatementLineItem,
     INCOME_STATEMENT_ITEMS,
     BALANCE_SHEET_ITEMS,
     CASH_FLOW_ITEMS,
@@ -27,6 +34,67 @@ GREEN_BG = "C6EFCE"
 RED_BG = "FFC7CE"
 LIGHT_GRAY = "F2F2F2"
 
+# Delta cell fill by delta_fills() code: increase, decrease, unchanged
+DELTA_FILLS = (GREEN_BG, RED_BG, None)
+
+# Markdown heading pattern for narrative lines (compiled once, used per line)
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
+
+def _statement_rows(items: tuple[StatementLineItem, ...]) -> tuple[tuple[str, str, bool], ...]:
+    """(metric_key, indented label, is_bold) per statement line item."""
+    return tuple(
+        (item.metric_key, ("    " if item.indent_level > 0 else "") + item.display_name, item.is_bold)
+        for item in items
+    )
+
+
+# Detailed statement rows; the line item lists are static, so labels are built once
+INCOME_STATEMENT_ROWS = _statement_rows(INCOME_STATEMENT_ITEMS)
+BALANCE_SHEET_ROWS = _statement_rows(BALANCE_SHEET_ITEMS)
+CASH_FLOW_ROWS = _statement_rows(CASH_FLOW_ITEMS)
+
+
+def parse_inline(text: str) -> list[tuple[str, str]]:
+    """
+    Split a line into ("bold" | "italic" | "plain", segment) runs.
+
+    Single left-to-right scan for **bold** and *italic* (bold is tried first
+    to avoid conflicts). A '*' that doesn't open a complete, non-empty span
+    is dropped.
+    """
+    segments = []
+    i = 0
+    n = len(text)
+    while i < n:
+        if text[i] != '*':
+            end = text.find('*', i)
+            if end == -1:
+                end = n
+            segments.append(("plain", text[i:end]))
+            i = end
+        elif text.startswith('**', i):
+            end = text.find('*', i + 2)
+            if end > i + 2 and text.startswith('**', end):
+                segments.append(("bold", text[i + 2:end]))
+                i = end + 2
+            else:
+                i += 1
+        else:
+            end = text.find('*', i + 1)
+            if end > i + 1:
+                segments.append(("italic", text[i + 1:end]))
+                i = end + 1
+            else:
+                i += 1
+    return segments
+
+
+def add_spacer(doc: Document):
+    """Add an empty paragraph for vertical spacing (bare <w:p/>, no Paragraph wrapper)."""
+    # add_p() keeps the body's trailing <w:sectPr> last
+    doc.element.body.add_p()
+
 
 def add_formatted_paragraph(doc: Document, text: str, level: int = None):
     """
@@ -38,7 +106,7 @@ def add_formatted_paragraph(doc: Document, text: str, level: int = None):
     - *italic*
     """
     # Check if this is a heading
-    heading_match = re.match(r'^(#{1,6})\s+(.+)$', text)
+    heading_match = HEADING_RE.match(text)
     if heading_match:
         heading_level = len(heading_match.group(1))
         heading_text = heading_match.group(2)
@@ -49,32 +117,135 @@ def add_formatted_paragraph(doc: Document, text: str, level: int = None):
     para = doc.add_paragraph()
 
     # Parse inline formatting: **bold** and *italic*
-    # Process **bold** first to avoid conflicts with *italic*
-    pattern = r'(\*\*[^*]+\*\*)|(\*[^*]+\*)|([^*]+)'
-
-    for match in re.finditer(pattern, text):
-        content = match.group(0)
-        if content.startswith('**') and content.endswith('**'):
-            # Bold text
-            run = para.add_run(content[2:-2])
+    for kind, content in parse_inline(text):
+        run = para.add_run(content)
+        if kind == "bold":
             run.bold = True
-        elif content.startswith('*') and content.endswith('*'):
-            # Italic text
-            run = para.add_run(content[1:-1])
+        elif kind == "italic":
             run.italic = True
-        else:
-            # Regular text
-            para.add_run(content)
 
 
-def set_cell_shading(cell, color_hex: str):
-    """Set background color of a table cell."""
-    shading = parse_xml(
+@functools.lru_cache(maxsize=None)
+def _shading_element(color_hex: str):
+    """Parsed <w:shd> template for a fill color (only a handful of colors are used)."""
+    return parse_xml(
         f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>'
     )
+
+
+def set_cell_shading(cell, color_hex: str):
+    """Set background color of a table cell."""
+    # An element can only have one parent, so each cell gets a copy of the template
+    shading = copy.deepcopy(_shading_element(color_hex))
     cell._tc.get_or_add_tcPr().append(shading)
 
 
+def delta_fills(current, prior) -> list[str | None]:
+    """
+    Delta cell fill per row for parallel sequences of current / prior values.
+
+    Green for an increase, red for a decrease, none when unchanged (same
+    classification as format_delta), computed for the whole table at once.
+    """
+    delta = np.asarray(current, dtype=np.float64) - np.asarray(prior, dtype=np.float64)
+    codes = np.where(delta > 0, 0, np.where(delta < 0, 1, 2))
+    return [DELTA_FILLS[code] for code in codes.tolist()]
+
+
+@functools.lru_cache(maxsize=None)
+def _run_properties(bold: bool = False, color_hex: str | None = None, font_size: int | None = None):
+    """Parsed <w:rPr> template for a run: bold, font color, size in points (children in schema order)."""
+    props = "".join((
+        "<w:b/>" if bold else "",
+        f'<w:color w:val="{color_hex}"/>' if color_hex else "",
+        f'<w:sz w:val="{font_size * 2}"/>' if font_size else "",
+    ))
+    return parse_xml(f'<w:rPr {nsdecls("w")}>{props}</w:rPr>')
+
+
+def set_header_cell(cell, text: str, font_size: int | None = None):
+    """
+    Write a table header cell: white bold text on HEADER_BLUE.
+
+    The shading and run properties are copied from cached templates onto the
+    run cell.text just created, instead of resolving the run and setting
+    each font attribute through python-docx.
+    """
+    cell.text = text
+    tc = cell._tc
+    tc.tcPr.append(copy.deepcopy(_shading_element(HEADER_BLUE)))
+    tc.p_lst[0].r_lst[0].insert(0, copy.deepcopy(_run_properties(True, "FFFFFF", font_size)))
+
+
+def set_cell_run(cell, text: str, bold: bool = False, font_size: int | None = None):
+    """
+    Write text into a freshly built (still empty) table cell as a single formatted run.
+
+    The run is created with its <w:rPr> already in place (copied from a cached
+    template), rather than assigning cell.text and then setting each font
+    attribute on the resulting run.
+    """
+    r = cell._tc.p_lst[0].add_r()
+    if bold or font_size:
+        r.append(copy.deepcopy(_run_properties(bold, None, font_size)))
+    r.text = text
+
+
+def table_cells(table) -> list[list[_Cell]]:
+    """
+    Snapshot a table's cells as one list per row.
+
+    table.rows[i] rebuilds the whole row list on every access and row.cells
+    re-walks the layout grid, so the table-building loops index this instead.
+    Only valid for the plain (unmerged) grids these reports build.
+    """
+    return [[_Cell(tc, table) for tc in tr.tc_lst] for tr in table._tbl.tr_lst]
+
+
+def shade_cells(cells, color_hex: str):
+    """
+    Set the background color of several cells of a freshly built table row.
+
+    Table cells python-docx creates always carry a <w:tcPr> (for the width),
+    so the shading is appended to it directly instead of via get_or_add_tcPr().
+    """
+    template = _shading_element(color_hex)
+    for cell in cells:
+        cell._tc.tcPr.append(copy.deepcopy(template))
+
+
+# Dollar multiplier for the normalized unit names sessions carry
+UNIT_SCALE = {
+    "billions": 1e9,
+    "millions": 1e6,
+    "thousands": 1e3,
+    "dollars": 1.0,
+}
+
+# (divisor, template) by magnitude bucket: 0: < $1M, 1: millions, 2: billions
+CURRENCY_FORMATS = (
+    (1.0, "${:,.0f}"),
+    (1e6, "${:,.1f} M"),
+    (1e9, "${:,.1f} B"),
+)
+
+
+def _in_dollars(value: float, unit: str) -> float:
+    """Convert a value reported in the given unit ("dollars", "thousands", "millions", ...) to dollars."""
+    scale = UNIT_SCALE.get(unit)
+    if scale is None:
+        # Not a normalized unit name; fall back to matching the wording
+        unit_lower = unit.lower()
+        if "million" in unit_lower:
+            scale = 1e6
+        elif "thousand" in unit_lower:
+            scale = 1e3
+        else:  # dollars or unknown
+            scale = 1.0
+    return value * scale
+
+
+@functools.lru_cache(maxsize=4096)
 def format_currency(value: float, unit: str = "dollars") -> str:
     """
     Format a currency value based on the unit.
@@ -87,26 +258,17 @@ def format_currency(value: float, unit: str = "dollars") -> str:
         return "-"
 
     # Convert value to base dollars based on unit
-    unit_lower = unit.lower()
-    if "million" in unit_lower:
-        value_in_dollars = value * 1e6
-    elif "thousand" in unit_lower:
-        value_in_dollars = value * 1e3
-    else:  # dollars or unknown
-        value_in_dollars = value
+    value_in_dollars = _in_dollars(value, unit)
 
     # Format the result
     abs_val = abs(value_in_dollars)
-    if abs_val >= 1e9:
-        formatted = f"${abs_val / 1e9:,.1f} B"
-    elif abs_val >= 1e6:
-        formatted = f"${abs_val / 1e6:,.1f} M"
-    else:
-        formatted = f"${abs_val:,.0f}"
+    divisor, template = CURRENCY_FORMATS[(abs_val >= 1e6) + (abs_val >= 1e9)]
+    formatted = template.format(abs_val / divisor)
 
     return f"-{formatted}" if value_in_dollars < 0 else formatted
 
 
+@functools.lru_cache(maxsize=4096)
 def format_percentage(value: float) -> str:
     """Format a decimal as percentage."""
     if value == 0:
@@ -114,6 +276,7 @@ def format_percentage(value: float) -> str:
     return f"{value * 100:.2f}%"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_ratio(value: float) -> str:
     """Format a ratio value."""
     if value == 0:
@@ -121,6 +284,7 @@ def format_ratio(value: float) -> str:
     return f"{value:.2f}x"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_delta(current: float, prior: float, unit: str = "dollars", is_percentage: bool = False, is_ratio: bool = False) -> tuple[str, str]:
     """
     Format a delta value and return (formatted_string, color).
@@ -145,19 +309,12 @@ def format_delta(current: float, prior: float, unit: str = "dollars", is_percent
         formatted = f"{delta:+.2f}x"
     else:
         # Currency - convert to base dollars first
-        unit_lower = unit.lower()
-        if "million" in unit_lower:
-            delta_in_dollars = delta * 1e6
-        elif "thousand" in unit_lower:
-            delta_in_dollars = delta * 1e3
-        else:
-            delta_in_dollars = delta
+        delta_in_dollars = _in_dollars(delta, unit)
 
+        # Deltas are always shown in millions or billions
         abs_delta = abs(delta_in_dollars)
-        if abs_delta >= 1e9:
-            formatted = f"${abs_delta / 1e9:,.1f} B"
-        else:
-            formatted = f"${abs_delta / 1e6:,.1f} M"
+        divisor, template = CURRENCY_FORMATS[1 + (abs_delta >= 1e9)]
+        formatted = template.format(abs_delta / divisor)
         if delta_in_dollars < 0:
             formatted = f"-{formatted}"
 
@@ -190,19 +347,17 @@ def add_financial_overview_table(doc: Document, metrics: FinancialMetrics, fisca
     table.style = "Table Grid"
 
     # Header row
-    header_cells = table.rows[0].cells
+    rows = table_cells(table)
+    header_cells = rows[0]
     headers = ["Financial Statements Overview", fiscal_year[:4], prior_year[:4], "Delta"]
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        set_cell_shading(header_cells[i], HEADER_BLUE)
-        run = header_cells[i].paragraphs[0].runs[0]
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(255, 255, 255)
+    for cell, header in zip(header_cells, headers):
+        set_header_cell(cell, header)
+
+    fills = delta_fills([row[1] for row in rows_data], [row[2] for row in rows_data])
 
     # Data rows
     for row_idx, (label, current, prior, is_pct, is_currency) in enumerate(rows_data):
-        row = table.rows[row_idx + 1]
-        cells = row.cells
+        cells = rows[row_idx + 1]
 
         # Label
         cells[0].text = label
@@ -224,21 +379,18 @@ def add_financial_overview_table(doc: Document, metrics: FinancialMetrics, fisca
             cells[2].text = str(prior)
 
         # Delta
-        delta_str, color = format_delta(current, prior, unit=unit, is_percentage=is_pct)
+        delta_str, _ = format_delta(current, prior, unit=unit, is_percentage=is_pct)
         cells[3].text = delta_str
 
         # Color the delta cell
-        if color == "green":
-            set_cell_shading(cells[3], GREEN_BG)
-        elif color == "red":
-            set_cell_shading(cells[3], RED_BG)
+        if fills[row_idx]:
+            set_cell_shading(cells[3], fills[row_idx])
 
         # Alternate row shading
         if row_idx % 2 == 1:
-            for cell in [cells[0], cells[1], cells[2]]:
-                set_cell_shading(cell, LIGHT_GRAY)
+            shade_cells(cells[:3], LIGHT_GRAY)
 
-    doc.add_paragraph()  # Spacing
+    add_spacer(doc)
 
 
 def add_ratios_table(doc: Document, ratios: FinancialRatios, fiscal_year: str, prior_year: str, unit: str = "dollars"):
@@ -264,19 +416,15 @@ def add_ratios_table(doc: Document, ratios: FinancialRatios, fiscal_year: str, p
     table.style = "Table Grid"
 
     # Header row
-    header_cells = table.rows[0].cells
+    rows = table_cells(table)
+    header_cells = rows[0]
     headers = ["Ratios", fiscal_year[:4], prior_year[:4], "Delta"]
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        set_cell_shading(header_cells[i], HEADER_BLUE)
-        run = header_cells[i].paragraphs[0].runs[0]
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(255, 255, 255)
+    for cell, header in zip(header_cells, headers):
+        set_header_cell(cell, header)
 
     # Data rows
     for row_idx, (label, current, prior, is_currency, decrease_is_good) in enumerate(rows_data):
-        row = table.rows[row_idx + 1]
-        cells = row.cells
+        cells = rows[row_idx + 1]
 
         # Label
         cells[0].text = label
@@ -316,10 +464,9 @@ def add_ratios_table(doc: Document, ratios: FinancialRatios, fiscal_year: str, p
 
         # Alternate row shading
         if row_idx % 2 == 1:
-            for cell in [cells[0], cells[1], cells[2]]:
-                set_cell_shading(cell, LIGHT_GRAY)
+            shade_cells(cells[:3], LIGHT_GRAY)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def add_sp_outlook_section(doc: Document, company_info: CompanyInfo, ttm_revenue: float = None, unit: str = "dollars"):
@@ -342,8 +489,9 @@ def add_sp_outlook_section(doc: Document, company_info: CompanyInfo, ttm_revenue
         ("TTM Revenue", format_currency(ttm_revenue, unit=unit) if ttm_revenue else EDIT_PLACEHOLDER),
     ]
 
+    rows = table_cells(table)
     for row_idx, (label, value) in enumerate(rows_data):
-        cells = table.rows[row_idx].cells
+        cells = rows[row_idx]
         cells[0].text = label
         cells[1].text = value
         # Right-align the value
@@ -353,7 +501,7 @@ def add_sp_outlook_section(doc: Document, company_info: CompanyInfo, ttm_revenue
             run = cells[1].paragraphs[0].runs[0]
             run.font.highlight_color = 7  # Yellow highlight
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def add_company_overview(doc: Document, company_info: CompanyInfo, narrative: str, logo_path: Path = None):
@@ -378,15 +526,15 @@ def add_company_overview(doc: Document, company_info: CompanyInfo, narrative: st
 
     # Narrative with markdown formatting support
     if narrative:
-        doc.add_paragraph()
+        add_spacer(doc)
         # Split narrative into lines and process each
         for line in narrative.split('\n'):
             if line.strip():
                 add_formatted_paragraph(doc, line.strip())
             else:
-                doc.add_paragraph()
+                add_spacer(doc)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def add_corporate_actions(doc: Document, actions: list[CorporateAction]):
@@ -397,14 +545,15 @@ def add_corporate_actions(doc: Document, actions: list[CorporateAction]):
         doc.add_paragraph("No recent corporate actions available.")
         return
 
-    for action in actions[:10]:  # Limit to 10 most recent
+    action_fields = operator.attrgetter("date", "description", "value")
+    for date, description, value in map(action_fields, actions[:10]):  # Limit to 10 most recent
         para = doc.add_paragraph(style="List Bullet")
-        para.add_run(f"{action.date}: ").bold = True
-        para.add_run(f"{action.description}")
-        if action.value:
-            para.add_run(f" (${action.value:.2f})")
+        para.add_run(f"{date}: ").bold = True
+        para.add_run(f"{description}")
+        if value:
+            para.add_run(f" (${value:.2f})")
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def add_ebitda_reconciliation(doc: Document, metrics: FinancialMetrics, fiscal_year: str, prior_year: str, unit: str = "dollars"):
@@ -433,18 +582,14 @@ def add_ebitda_reconciliation(doc: Document, metrics: FinancialMetrics, fiscal_y
     table.style = "Table Grid"
 
     # Header
-    header_cells = table.rows[0].cells
+    rows = table_cells(table)
+    header_cells = rows[0]
     headers = ["", fiscal_year[:4], prior_year[:4]]
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        set_cell_shading(header_cells[i], HEADER_BLUE)
-        run = header_cells[i].paragraphs[0].runs[0]
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(255, 255, 255)
+    for cell, header in zip(header_cells, headers):
+        set_header_cell(cell, header)
 
     for row_idx, (label, current, prior) in enumerate(rows_data):
-        row = table.rows[row_idx + 1]
-        cells = row.cells
+        cells = rows[row_idx + 1]
         cells[0].text = label
         cells[1].text = format_currency(current, unit=unit)
         cells[2].text = format_currency(prior, unit=unit)
@@ -455,98 +600,83 @@ def add_ebitda_reconciliation(doc: Document, metrics: FinancialMetrics, fiscal_y
                 for run in cell.paragraphs[0].runs:
                     run.font.bold = True
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def add_detailed_statement_table(
     doc: Document,
     title: str,
-    items: list,
+    line_items: tuple[tuple[str, str, bool], ...],
     session: ExtractionSession,
     fiscal_year: str,
     prior_year: str,
     unit: str = "dollars",
 ):
-    """Add a detailed financial statement table (Income Statement, Balance Sheet, or Cash Flow)."""
+    """
+    Add a detailed financial statement table (Income Statement, Balance Sheet, or Cash Flow).
+
+    line_items are (metric_key, label, is_bold) rows, e.g. INCOME_STATEMENT_ROWS.
+    """
     doc.add_heading(title, level=2)
 
     # Filter to items with data
-    visible = [item for item in items if item.metric_key in session.raw_values]
+    raw_values = session.raw_values
+    visible = [row for row in line_items if row[0] in raw_values]
     if not visible:
         doc.add_paragraph(f"No {title.lower()} data available.")
         return
 
-    table = doc.add_table(rows=1 + len(visible), cols=4)
+    table = doc.add_table(rows=1, cols=4)
     table.style = "Table Grid"
     table.autofit = False
 
-    # Set column widths: wider label column, equal value columns
+    # Set column widths: wider label column, equal value columns. Word sizes
+    # cells from their own width rather than the grid, so every cell needs
+    # it; set it once on the still-empty first row and clone that row for
+    # the data rows
     col_widths = [Inches(2.8), Inches(1.4), Inches(1.4), Inches(1.4)]
-    for col_idx, width in enumerate(col_widths):
+    first_tr = table._tbl.tr_lst[0]
+    for col_idx, (width, tc) in enumerate(zip(col_widths, first_tr.tc_lst)):
         table.columns[col_idx].width = width
+        tc.width = width
+    for _ in visible:
+        table._tbl.append(copy.deepcopy(first_tr))
+
+    rows = table_cells(table)
 
     # Header
     headers = [title, fiscal_year[:4], prior_year[:4], "Delta"]
-    for i, header in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        cell.width = col_widths[i]
-        cell.text = header
-        set_cell_shading(cell, HEADER_BLUE)
-        run = cell.paragraphs[0].runs[0]
-        run.font.bold = True
-        run.font.size = Pt(9)
-        run.font.color.rgb = RGBColor(255, 255, 255)
+    for cell, header in zip(rows[0], headers):
+        set_header_cell(cell, header, font_size=9)
+
+    # (current, prior) per row as columns, read off the ExtractedValues once
+    current_col, prior_col = session.value_columns([row[0] for row in visible])
+    fills = delta_fills(current_col, prior_col)
+    values = zip(current_col.tolist(), prior_col.tolist())
 
     row_idx = 0
-    for item in visible:
+    for (_, label, is_bold), (current, prior), fill in zip(visible, values, fills):
         row_idx += 1
-        ev = session.raw_values[item.metric_key]
-        row = table.rows[row_idx]
-        cells = row.cells
+        cells = rows[row_idx]
 
-        # Set widths on every row to prevent Word from auto-resizing
-        for ci in range(4):
-            cells[ci].width = col_widths[ci]
-
-        # Label with indent
-        label = ("    " if item.indent_level > 0 else "") + item.display_name
-        cells[0].text = label
-        for run in cells[0].paragraphs[0].runs:
-            run.font.size = Pt(9)
-            if item.is_bold:
-                run.font.bold = True
+        # Label with indent; subtotal rows are bold across every cell
+        set_cell_run(cells[0], label, bold=is_bold, font_size=9)
 
         # Values
-        for ci, val_text in enumerate([
-            format_currency(ev.value, unit=unit),
-            format_currency(ev.value_prior, unit=unit),
-        ], start=1):
-            cells[ci].text = val_text
-            for run in cells[ci].paragraphs[0].runs:
-                run.font.size = Pt(9)
+        set_cell_run(cells[1], format_currency(current, unit=unit), bold=is_bold, font_size=9)
+        set_cell_run(cells[2], format_currency(prior, unit=unit), bold=is_bold, font_size=9)
 
         # Delta
-        delta_str, color = format_delta(ev.value, ev.value_prior, unit=unit)
-        cells[3].text = delta_str
-        for run in cells[3].paragraphs[0].runs:
-            run.font.size = Pt(9)
-        if color == "green":
-            set_cell_shading(cells[3], GREEN_BG)
-        elif color == "red":
-            set_cell_shading(cells[3], RED_BG)
-
-        # Bold subtotal rows
-        if item.is_bold:
-            for cell in cells:
-                for run in cell.paragraphs[0].runs:
-                    run.font.bold = True
+        delta_str, _ = format_delta(current, prior, unit=unit)
+        set_cell_run(cells[3], delta_str, bold=is_bold, font_size=9)
+        if fill:
+            set_cell_shading(cells[3], fill)
 
         # Alternate row shading
         if row_idx % 2 == 0:
-            for cell in [cells[0], cells[1], cells[2]]:
-                set_cell_shading(cell, LIGHT_GRAY)
+            shade_cells(cells[:3], LIGHT_GRAY)
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def add_verification_summary(doc: Document, verification: VerificationResult):
@@ -570,7 +700,7 @@ def add_verification_summary(doc: Document, verification: VerificationResult):
         run.font.color.rgb = RGBColor(200, 0, 0)  # Red
 
     if failed:
-        doc.add_paragraph()
+        add_spacer(doc)
         for check in failed:
             para = doc.add_paragraph(style="List Bullet")
             severity = "ERROR" if check.severity == "error" else "WARNING"
@@ -578,7 +708,7 @@ def add_verification_summary(doc: Document, verification: VerificationResult):
             para.add_run(f"{check.description} ({check.year}): {check.formula}")
             para.add_run(f" — Diff: {check.difference:,.0f}")
 
-    doc.add_paragraph()
+    add_spacer(doc)
 
 
 def generate_word_report(
@@ -651,21 +781,24 @@ def generate_word_report(
     # EBITDA Reconciliation
     add_ebitda_reconciliation(doc, metrics, fiscal_year_end, fiscal_year_end_prior, unit=unit)
 
-    # Detailed Financial Statements (if session data available)
+    # Detailed Financial Statements (if session data available). The three
+    # tables are built in sequence on this document: the work is GIL-bound
+    # python-docx object construction, so building them on scratch documents
+    # in worker threads measured slower, not faster
     if session:
         doc.add_page_break()
         doc.add_heading("Detailed Financial Statements", level=1)
 
         add_detailed_statement_table(
-            doc, "Income Statement", INCOME_STATEMENT_ITEMS, session,
+            doc, "Income Statement", INCOME_STATEMENT_ROWS, session,
             fiscal_year_end, fiscal_year_end_prior, unit=unit,
         )
         add_detailed_statement_table(
-            doc, "Balance Sheet", BALANCE_SHEET_ITEMS, session,
+            doc, "Balance Sheet", BALANCE_SHEET_ROWS, session,
             fiscal_year_end, fiscal_year_end_prior, unit=unit,
         )
         add_detailed_statement_table(
-            doc, "Cash Flow Statement", CASH_FLOW_ITEMS, session,
+            doc, "Cash Flow Statement", CASH_FLOW_ROWS, session,
             fiscal_year_end, fiscal_year_end_prior, unit=unit,
         )
 
@@ -681,5 +814,12 @@ def generate_word_report(
     else:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
+        # Write to a sibling temp file and rename it into place, so anything
+        # watching output_path never sees a partially written document
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        try:
+            doc.save(tmp_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
         return output_path
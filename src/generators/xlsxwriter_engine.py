@@ -0,0 +1,187 @@
+"""
+XlsxWriter backend for the Excel export.
+
+The sheet builders in excel_export.py are written against openpyxl's
+write-only API (create_sheet / column_dimensions / append of WriteOnlyCell).
+This module provides a workbook with the same surface that streams each
+appended row into an XlsxWriter workbook in constant_memory mode instead,
+translating openpyxl cell styles into XlsxWriter formats (created once per
+distinct style and reused).
+
+XlsxWriter is an optional dependency; it is only imported when the
+"xlsxwriter" engine is requested.
+"""
+
+from typing import BinaryIO
+
+import xlsxwriter
+from openpyxl import Workbook
+from openpyxl.cell.cell import Cell
+
+
+# openpyxl border styles -> XlsxWriter border indices
+BORDER_STYLES = {
+    "thin": 1,
+    "medium": 2,
+    "dashed": 3,
+    "dotted": 4,
+    "thick": 5,
+    "double": 6,
+    "hair": 7,
+}
+
+# openpyxl vertical alignment -> XlsxWriter valign
+VERTICAL_ALIGN = {
+    "top": "top",
+    "center": "vcenter",
+    "bottom": "bottom",
+    "justify": "vjustify",
+    "distributed": "vdistributed",
+}
+
+
+def _rgb(color) -> str | None:
+    """Convert an openpyxl RGB/ARGB color to '#RRGGBB' (None for theme/indexed colors)."""
+    if color is None or color.type != "rgb":
+        return None
+    return f"#{color.rgb[-6:]}"
+
+
+def _format_props(cell: Cell) -> dict:
+    """Translate the styles set on an openpyxl cell into XlsxWriter format properties."""
+    props = {}
+
+    font = cell.font
+    if font.b:
+        props["bold"] = True
+    if font.i:
+        props["italic"] = True
+    if font.sz:
+        props["font_size"] = font.sz
+    font_color = _rgb(font.color)
+    if font_color:
+        props["font_color"] = font_color
+
+    fill = cell.fill
+    if fill.fill_type == "solid":
+        bg_color = _rgb(fill.fgColor)
+        if bg_color:
+            props["bg_color"] = bg_color
+
+    border = cell.border
+    for side in ("left", "right", "top", "bottom"):
+        style = getattr(border, side).style
+        if style in BORDER_STYLES:
+            props[side] = BORDER_STYLES[style]
+
+    alignment = cell.alignment
+    if alignment.horizontal:
+        props["align"] = alignment.horizontal
+    if alignment.vertical in VERTICAL_ALIGN:
+        props["valign"] = VERTICAL_ALIGN[alignment.vertical]
+    if alignment.wrap_text:
+        props["text_wrap"] = True
+
+    if cell.number_format != "General":
+        props["num_format"] = cell.number_format
+
+    return props
+
+
+class _ColumnDimension:
+    def __init__(self, ws, letter: str):
+        self._ws = ws
+        self._letter = letter
+
+    @property
+    def width(self):
+        raise AttributeError("width is write-only")
+
+    @width.setter
+    def width(self, value: float):
+        self._ws.set_column(f"{self._letter}:{self._letter}", value)
+
+
+class _RowDimension:
+    def __init__(self, ws, row: int):
+        self._ws = ws
+        self._row = row
+
+    @property
+    def height(self):
+        raise AttributeError("height is write-only")
+
+    @height.setter
+    def height(self, value: float):
+        self._ws.set_row(self._row - 1, value)
+
+
+class _Dimensions:
+    """Minimal stand-in for openpyxl's column_dimensions / row_dimensions."""
+
+    def __init__(self, ws, factory):
+        self._ws = ws
+        self._factory = factory
+
+    def __getitem__(self, key):
+        return self._factory(self._ws, key)
+
+
+class XlsxWriterSheet:
+    """Worksheet with the subset of openpyxl's write-only API used by the sheet builders."""
+
+    def __init__(self, book: "XlsxWriterWorkbook", ws):
+        self._book = book
+        self._ws = ws
+        self._row = 0
+        # WriteOnlyCell(ws, ...) registers styles on ws.parent
+        self.parent = book.styles
+        self.column_dimensions = _Dimensions(ws, lambda ws, key: _ColumnDimension(ws, key))
+        self.row_dimensions = _Dimensions(ws, lambda ws, key: _RowDimension(ws, key))
+
+    def append(self, values):
+        """Write a row of plain values and/or WriteOnlyCells."""
+        ws = self._ws
+        row = self._row
+        for col, value in enumerate(values):
+            if isinstance(value, Cell):
+                fmt = self._book.format_for(value) if value.has_style else None
+                ws.write(row, col, value.value, fmt)
+            elif value is not None:
+                ws.write(row, col, value)
+        self._row += 1
+
+
+class XlsxWriterWorkbook:
+    """
+    Workbook with the subset of openpyxl's write-only API used by the sheet builders.
+
+    Rows are written to XlsxWriter as they are appended; save() finalises
+    the file into the buffer given at construction.
+    """
+
+    def __init__(self, buffer: BinaryIO):
+        # constant_memory keeps only the current row in RAM; in_memory would
+        # override it, so rows are flushed through XlsxWriter's temp files
+        self._wb = xlsxwriter.Workbook(buffer, {"constant_memory": True})
+        self._buffer = buffer
+        self._formats = {}
+        # Scratch openpyxl workbook that owns the style collections
+        # WriteOnlyCell styles are registered against; never saved
+        self.styles = Workbook(write_only=True)
+
+    def create_sheet(self, title: str) -> XlsxWriterSheet:
+        return XlsxWriterSheet(self, self._wb.add_worksheet(title))
+
+    def format_for(self, cell: Cell):
+        """Return the XlsxWriter format for a styled cell, creating it once per distinct style."""
+        key = tuple(cell._style)
+        fmt = self._formats.get(key)
+        if fmt is None:
+            fmt = self._formats[key] = self._wb.add_format(_format_props(cell))
+        return fmt
+
+    def save(self, buffer: BinaryIO):
+        if buffer is not self._buffer:
+            raise ValueError("XlsxWriterWorkbook can only save to the buffer it was created with")
+        self._wb.close()
@@ -1,12 +1,26 @@
 """Data models for extraction sessions with source citations."""
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
+import sys
 import uuid
 
+import numpy as np
 
-@dataclass
-class SourceCitation:
+
+def _intern(value):
+    """sys.intern for strings; anything else (e.g. a missing field read as None) passes through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class _DictCacheSlot:
+    """Base class providing a slot for a memoized to_dict() result, outside the dataclass fields."""
+    __slots__ = ("_dict_cache",)
+
+
+@dataclass(slots=True)
+class SourceCitation(_DictCacheSlot):
     """
     Source citation for an extracted financial value.
     Links back to the original SEC filing for audit trail.
@@ -21,22 +35,40 @@ class SourceCitation:
     raw_value: float         # The actual value from the filing
     statement: str = ""      # Which financial statement (e.g., "Income Statement", "Balance Sheet")
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "xbrl_concept": self.xbrl_concept,
-            "xbrl_label": self.xbrl_label,
-            "filing_url": self.filing_url,
-            "accession_number": self.accession_number,
-            "filing_date": self.filing_date,
-            "form_type": self.form_type,
-            "period_end": self.period_end,
-            "raw_value": self.raw_value,
-            "statement": self.statement,
-        }
-
+    def __post_init__(self):
+        # Every citation from one filing repeats these; share a single string object per value
+        self.xbrl_concept = _intern(self.xbrl_concept)
+        self.xbrl_label = _intern(self.xbrl_label)
+        self.accession_number = _intern(self.accession_number)
+        self.filing_date = _intern(self.filing_date)
+        self.form_type = _intern(self.form_type)
+        self.statement = _intern(self.statement)
 
-@dataclass
+    def to_dict(self) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Citations are never modified after construction, so the dict is built
+        on first call and cached; each call returns a shallow copy of it.
+        """
+        try:
+            cached = self._dict_cache
+        except AttributeError:
+            cached = self._dict_cache = {
+                "xbrl_concept": self.xbrl_concept,
+                "xbrl_label": self.xbrl_label,
+                "filing_url": self.filing_url,
+                "accession_number": self.accession_number,
+                "filing_date": self.filing_date,
+                "form_type": self.form_type,
+                "period_end": self.period_end,
+                "raw_value": self.raw_value,
+                "statement": self.statement,
+            }
+        return cached.copy()
+
+
+@dataclass(slots=True)
 class ConceptMapping:
     """
     LLM's mapping of an XBRL concept to a required metric.
@@ -56,7 +88,7 @@ class ConceptMapping:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedValue:
     """
     A single extracted financial value with its source citation.
@@ -84,7 +116,7 @@ class ExtractedValue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UnmappedValue:
     """
     An XBRL concept that wasn't mapped to a required metric but may be notable.
@@ -111,7 +143,7 @@ class UnmappedValue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NotFoundMetric:
     """
     A required metric that couldn't be found in the XBRL data.
@@ -129,7 +161,7 @@ class NotFoundMetric:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculationStep:
     """
     A single step in a calculation, for audit trail purposes.
@@ -151,7 +183,7 @@ class CalculationStep:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionSession:
     """
     Represents a complete extraction session.
@@ -218,6 +250,22 @@ class ExtractionSession:
             "llm_warnings": self.llm_warnings,
         }
 
+    def value_columns(self, metric_keys) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Current and prior values for metric_keys as parallel float64 arrays.
+
+        A columnar snapshot of raw_values for vectorized calculations over
+        many metrics; keys without an extracted value are NaN.
+        """
+        raw_values = self.raw_values
+        nan = float("nan")
+        pairs = [
+            (ev.value, ev.value_prior) if (ev := raw_values.get(key)) is not None else (nan, nan)
+            for key in metric_keys
+        ]
+        columns = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+        return columns[:, 0], columns[:, 1]
+
     def get_raw_value(self, metric_key: str, prior: bool = False) -> float | None:
         """Get a raw value by metric key."""
         if metric_key not in self.raw_values:
@@ -227,35 +275,16 @@ class ExtractionSession:
 
     def set_raw_value(self, metric_key: str, value: float, prior: bool = False) -> None:
         """Update a raw value (used for user edits)."""
-        if metric_key in self.raw_values:
-            ev = self.raw_values[metric_key]
+        ev = self.raw_values.get(metric_key)
+        if ev is not None:
             if prior:
-                # Create new ExtractedValue with updated prior value
-                self.raw_values[metric_key] = ExtractedValue(
-                    metric_key=ev.metric_key,
-                    display_name=ev.display_name,
-                    value=ev.value,
-                    value_prior=value,
-                    citation=ev.citation,
-                    citation_prior=ev.citation_prior,
-                    llm_reasoning=ev.llm_reasoning,
-                    is_editable=ev.is_editable,
-                )
+                ev.value_prior = value
             else:
-                self.raw_values[metric_key] = ExtractedValue(
-                    metric_key=ev.metric_key,
-                    display_name=ev.display_name,
-                    value=value,
-                    value_prior=ev.value_prior,
-                    citation=ev.citation,
-                    citation_prior=ev.citation_prior,
-                    llm_reasoning=ev.llm_reasoning,
-                    is_editable=ev.is_editable,
-                )
-
-
-# Display name mapping for metrics
-METRIC_DISPLAY_NAMES = {
+                ev.value = value
+
+
+# Display name mapping for metrics (read-only; shared by every extractor)
+METRIC_DISPLAY_NAMES = MappingProxyType({
     # === Income Statement ===
     "revenue": "Top Line Revenue",
     "cost_of_revenue": "Cost of Revenue",
@@ -338,11 +367,11 @@ METRIC_DISPLAY_NAMES = {
     "working_capital": "Working Capital",
     "return_on_assets": "Return on Assets",
     "return_on_equity": "Return on Equity",
-}
+})
 
 
-# Required base metrics that LLM should map from XBRL
-REQUIRED_BASE_METRICS = [
+# Required base metrics that LLM should map from XBRL (in prompt order)
+REQUIRED_BASE_METRICS = (
     # Income Statement
     "revenue",
     "cost_of_revenue",
@@ -399,10 +428,13 @@ REQUIRED_BASE_METRICS = [
     "cf_other_financing",
     "cash_from_financing",
     "net_change_in_cash",
-]
+)
+
+# For membership checks
+REQUIRED_BASE_METRICS_SET = frozenset(REQUIRED_BASE_METRICS)
 
 
-@dataclass
+@dataclass(slots=True)
 class StatementLineItem:
     """Metadata for rendering a single line item in a financial statement."""
     metric_key: str
@@ -417,7 +449,7 @@ class StatementLineItem:
 
 # === Financial Statement Line Item Registries ===
 
-INCOME_STATEMENT_ITEMS = [
+INCOME_STATEMENT_ITEMS = (
     StatementLineItem("revenue", "Top Line Revenue", "income_statement", "", 0, False, True, 0),
     StatementLineItem("cost_of_revenue", "Cost of Revenue", "income_statement", "", 1, False, False, 1),
     StatementLineItem("gross_profit", "Gross Profit", "income_statement", "", 0, True, True, 2),
@@ -433,9 +465,9 @@ INCOME_STATEMENT_ITEMS = [
     StatementLineItem("income_tax_expense", "Income Tax Expense", "income_statement", "", 1, False, False, 12),
     StatementLineItem("net_income", "Net Income", "income_statement", "", 0, True, True, 13),
     StatementLineItem("stock_compensation", "Stock-Based Compensation", "income_statement", "", 1, False, False, 14),
-]
+)
 
-BALANCE_SHEET_ITEMS = [
+BALANCE_SHEET_ITEMS = (
     # Current Assets
     StatementLineItem("cash", "Cash & Cash Equivalents", "balance_sheet", "Current Assets", 1, False, False, 0),
     StatementLineItem("short_term_investments", "Short-term Investments", "balance_sheet", "Current Assets", 1, False, False, 1),
@@ -461,9 +493,9 @@ BALANCE_SHEET_ITEMS = [
     StatementLineItem("total_liabilities", "Total Liabilities", "balance_sheet", "", 0, True, True, 18),
     # Equity
     StatementLineItem("stockholders_equity", "Stockholders' Equity", "balance_sheet", "Equity", 0, True, True, 19),
-]
+)
 
-CASH_FLOW_ITEMS = [
+CASH_FLOW_ITEMS = (
     # Operating Activities
     StatementLineItem("cf_net_income", "Net Income", "cash_flow", "Operating Activities", 1, False, False, 0),
     StatementLineItem("cf_depreciation_amortization", "Depreciation & Amortization", "cash_flow", "Operating Activities", 1, False, False, 1),
@@ -484,4 +516,4 @@ CASH_FLOW_ITEMS = [
     StatementLineItem("cash_from_financing", "Cash from Financing", "cash_flow", "Financing Activities", 0, True, True, 14),
     # Net Change
     StatementLineItem("net_change_in_cash", "Net Change in Cash", "cash_flow", "", 0, True, True, 15),
-]
+)
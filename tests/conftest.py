@@ -0,0 +1,18 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from src.fetchers import yahoo
+
+
+@pytest.fixture(autouse=True)
+def yahoo_cache_dir(tmp_path, monkeypatch):
+    """Point the Yahoo Finance disk cache at a per-test directory (never the user's real cache)."""
+    cache_dir = tmp_path / "yahoo-cache"
+    monkeypatch.setenv("CREDITREVIEW_CACHE_DIR", str(cache_dir))
+    yahoo._disk_cache.cache_clear()
+    yield cache_dir
+    cache = yahoo._disk_cache()
+    if cache is not None:
+        cache.close()
+    yahoo._disk_cache.cache_clear()
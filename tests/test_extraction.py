@@ -0,0 +1,48 @@
+"""Tests for the extraction session models."""
+
+import copy
+import dataclasses
+import pickle
+
+from src.models.extraction import SourceCitation
+
+
+def _citation() -> SourceCitation:
+    return SourceCitation(
+        xbrl_concept="us-gaap:Revenues",
+        xbrl_label="Revenues",
+        filing_url="https://www.sec.gov/Archives/edgar/data/1/000000000124000001.htm",
+        accession_number="0000000001-24-000001",
+        filing_date="2025-02-01",
+        form_type="10-K",
+        period_end="2024-12-31",
+        raw_value=1.5e9,
+        statement="Income Statement",
+    )
+
+
+def test_citation_to_dict_is_not_shared():
+    citation = _citation()
+
+    first = citation.to_dict()
+    first["extra"] = True
+    first.pop("raw_value")
+
+    assert citation.to_dict() == dataclasses.asdict(citation)
+
+
+def test_citation_dict_cache_is_not_a_field():
+    citation = _citation()
+    citation.to_dict()
+
+    assert "_dict_cache" not in {f.name for f in dataclasses.fields(citation)}
+    assert "_dict_cache" not in dataclasses.asdict(citation)
+    assert citation == _citation()
+
+
+def test_citation_copies_serialize():
+    citation = _citation()
+    expected = citation.to_dict()
+
+    assert copy.copy(citation).to_dict() == expected
+    assert pickle.loads(pickle.dumps(citation)).to_dict() == expected
@@ -0,0 +1,119 @@
+"""Tests for the XlsxWriter Excel backend (output must match the openpyxl engine)."""
+
+import io
+
+import pytest
+from openpyxl import load_workbook
+
+from src.calculators.metrics import calculate_metrics_from_raw
+from src.calculators.ratios import calculate_ratios_from_raw
+from src.calculators.verification import run_verification
+from src.generators.excel_export import generate_excel_report
+from src.models.extraction import (
+    METRIC_DISPLAY_NAMES,
+    REQUIRED_BASE_METRICS,
+    ExtractedValue,
+    ExtractionSession,
+    SourceCitation,
+)
+
+pytest.importorskip("xlsxwriter")
+
+from src.generators.xlsxwriter_engine import XlsxWriterWorkbook
+
+
+# Metrics left out of the partial session so the "missing input" paths are exercised
+MISSING_METRICS = ("gross_profit", "total_debt", "stock_compensation", "goodwill")
+
+
+def _session(missing: tuple[str, ...] = ()) -> ExtractionSession:
+    session = ExtractionSession.create("ACME", "Acme Corp", "0000000001")
+    session.fiscal_year_end = "2024-12-31"
+    session.fiscal_year_end_prior = "2023-12-31"
+    session.unit = "millions"
+    for i, key in enumerate(REQUIRED_BASE_METRICS):
+        if key in missing:
+            continue
+        citation = SourceCitation(
+            xbrl_concept=f"us-gaap:{key}",
+            xbrl_label=METRIC_DISPLAY_NAMES[key],
+            filing_url="https://www.sec.gov/Archives/edgar/data/1/000000000124000001.htm",
+            accession_number="0000000001-24-000001",
+            filing_date="2025-02-01",
+            form_type="10-K",
+            period_end="2024-12-31",
+            raw_value=(i + 1) * 1e6,
+            statement="Income Statement",
+        )
+        session.raw_values[key] = ExtractedValue(
+            metric_key=key,
+            display_name=METRIC_DISPLAY_NAMES[key],
+            value=(i + 1) * 1e6,
+            value_prior=(i - 3) * 1e6,
+            citation=citation if i % 4 else None,
+            citation_prior=citation,
+            llm_reasoning="",
+        )
+    return session
+
+
+def _workbook(session: ExtractionSession, engine: str):
+    metrics, metric_steps = calculate_metrics_from_raw(session)
+    ratios, ratio_steps = calculate_ratios_from_raw(
+        session,
+        ebitda=metrics.ebitda,
+        ebitda_prior=metrics.ebitda_prior,
+        adjusted_ebitda=metrics.adjusted_ebitda,
+        adjusted_ebitda_prior=metrics.adjusted_ebitda_prior,
+    )
+    buffer = generate_excel_report(
+        session=session,
+        metrics=metrics,
+        ratios=ratios,
+        calculation_steps=metric_steps + ratio_steps,
+        verification=run_verification(session),
+        engine=engine,
+    )
+    return load_workbook(buffer)
+
+
+def _cells(ws) -> dict[str, tuple]:
+    """Value (formulas included) and number format of every non-empty cell."""
+    return {
+        cell.coordinate: (cell.value, cell.number_format)
+        for row in ws.iter_rows()
+        for cell in row
+        if cell.value is not None
+    }
+
+
+@pytest.mark.parametrize("missing", [(), MISSING_METRICS], ids=["complete", "partial"])
+def test_xlsxwriter_matches_openpyxl(missing):
+    session = _session(missing)
+    expected = _workbook(session, "openpyxl")
+    actual = _workbook(session, "xlsxwriter")
+
+    assert actual.sheetnames == expected.sheetnames
+    for name in expected.sheetnames:
+        assert _cells(actual[name]) == _cells(expected[name]), name
+
+
+def test_xlsxwriter_has_formulas():
+    wb = _workbook(_session(), "xlsxwriter")
+
+    formulas = [
+        cell.value
+        for ws in wb.worksheets
+        for row in ws.iter_rows()
+        for cell in row
+        if isinstance(cell.value, str) and cell.value.startswith("=")
+    ]
+    assert formulas
+
+
+def test_save_rejects_other_buffer():
+    wb = XlsxWriterWorkbook(io.BytesIO())
+    wb.create_sheet("Sheet")
+
+    with pytest.raises(ValueError, match="buffer it was created with"):
+        wb.save(io.BytesIO())
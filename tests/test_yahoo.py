@@ -0,0 +1,381 @@
+"""Tests for the Yahoo Finance fetchers (yfinance is mocked; no network)."""
+
+import asyncio
+import json
+import threading
+import time
+import warnings
+from concurrent.futures import Future, wait
+from types import SimpleNamespace
+
+import pytest
+import requests
+from yfinance.exceptions import YFException
+
+from src.fetchers import yahoo
+from src.fetchers.yahoo import CompanyInfo
+
+
+class FakeTicker:
+    """Stand-in for yf.Ticker exposing a fixed .info dict."""
+
+    def __init__(self, info: dict):
+        self.info = info
+
+
+class CountingTicker:
+    """yf.Ticker factory returning a fixed .info dict and counting lookups."""
+
+    def __init__(self, info: dict):
+        self.info = info
+        self.calls = 0
+
+    def __call__(self, ticker: str) -> FakeTicker:
+        self.calls += 1
+        return FakeTicker(self.info)
+
+
+def test_fetch_company_info_reads_ticker_info(monkeypatch):
+    info = {
+        "longName": "Acme Corp",
+        "sector": "Industrials",
+        "industry": "Machinery",
+        "website": "https://acme.example",
+        "longBusinessSummary": "Makes anvils.",
+        "fullTimeEmployees": 1200,
+        "city": "Springfield",
+        "state": "IL",
+        "country": "United States",
+    }
+    monkeypatch.setattr(yahoo.yf, "Ticker", lambda ticker: FakeTicker(info))
+
+    assert yahoo.fetch_company_info("ACME") == CompanyInfo(
+        name="Acme Corp",
+        ticker="ACME",
+        sector="Industrials",
+        industry="Machinery",
+        website="https://acme.example",
+        description="Makes anvils.",
+        employees=1200,
+        hq_city="Springfield",
+        hq_state="IL",
+        hq_country="United States",
+    )
+
+
+def test_fetch_company_info_defaults_missing_fields(monkeypatch):
+    monkeypatch.setattr(yahoo.yf, "Ticker", lambda ticker: FakeTicker({"longName": "Acme Corp"}))
+
+    assert yahoo.fetch_company_info("ACME") == CompanyInfo(name="Acme Corp", ticker="ACME")
+
+
+def test_fetch_company_info_is_cached(monkeypatch):
+    ticker = CountingTicker({"longName": "Acme Corp"})
+    monkeypatch.setattr(yahoo.yf, "Ticker", ticker)
+
+    yahoo.fetch_company_info("ACME")
+    assert yahoo.fetch_company_info("ACME").name == "Acme Corp"
+    assert ticker.calls == 1
+
+
+def test_empty_company_info_is_not_cached(monkeypatch):
+    ticker = CountingTicker({})
+    monkeypatch.setattr(yahoo.yf, "Ticker", ticker)
+
+    assert yahoo.fetch_company_info("ACME").name == ""
+    ticker.info = {"longName": "Acme Corp"}
+    assert yahoo.fetch_company_info("ACME").name == "Acme Corp"
+    assert ticker.calls == 2
+
+
+def test_cache_is_created_on_first_use(yahoo_cache_dir, monkeypatch):
+    monkeypatch.setattr(yahoo.yf, "Ticker", CountingTicker({"longName": "Acme Corp"}))
+
+    assert not yahoo_cache_dir.exists()
+    yahoo.fetch_company_info("ACME")
+    assert yahoo_cache_dir.is_dir()
+
+
+def test_unusable_cache_dir_disables_caching(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("CREDITREVIEW_CACHE_DIR", str(blocker / "yahoo"))
+    ticker = CountingTicker({"longName": "Acme Corp"})
+    monkeypatch.setattr(yahoo.yf, "Ticker", ticker)
+
+    with pytest.warns(UserWarning, match="cache disabled"):
+        assert yahoo.fetch_company_info("ACME").name == "Acme Corp"
+    assert yahoo.fetch_company_info("ACME").name == "Acme Corp"
+    assert ticker.calls == 2
+
+
+@pytest.fixture
+def yf_config():
+    """Snapshot and restore the yfinance global config touched by configure_yfinance."""
+    proxy = yahoo.yf.config.network.proxy
+    logging = yahoo.yf.config.debug.logging
+    yield yahoo.yf.config
+    yahoo.yf.config.network.proxy = proxy
+    yahoo.yf.config.debug.logging = logging
+
+
+def test_configure_yfinance_applies_environment(yf_config, monkeypatch):
+    for name in ("HTTPS_PROXY", "https_proxy", "HTTP_PROXY", "http_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setenv("CREDITREVIEW_DEBUG", "1")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        yahoo.configure_yfinance()
+
+    assert yf_config.network.proxy == {
+        "http": "http://proxy.example:3128",
+        "https": "http://proxy.example:3128",
+    }
+    assert yf_config.debug.logging is True
+
+
+@pytest.mark.parametrize("error", [
+    json.JSONDecodeError("Expecting value", "", 0),
+    KeyError("quoteSummary"),
+    requests.HTTPError("404 Client Error"),
+    YFException("No data found"),
+])
+def test_batch_skips_ticker_with_non_network_error(monkeypatch, error):
+    def ticker_factory(ticker):
+        if ticker == "ERR":
+            raise error
+        return FakeTicker({"longName": f"{ticker} Inc"})
+
+    monkeypatch.setattr(yahoo.yf, "Ticker", ticker_factory)
+
+    with pytest.warns(UserWarning, match="ERR"):
+        results = yahoo.fetch_company_info_many(["CCC", "ERR"])
+
+    assert list(results) == ["CCC"]
+    assert results["CCC"].name == "CCC Inc"
+
+
+class FlakyFetcher:
+    """Stub fetcher raising ConnectionError for the first `failures` calls."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self, ticker: str) -> CompanyInfo:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise requests.ConnectionError("connection reset")
+        return CompanyInfo(name=f"{ticker} Inc", ticker=ticker)
+
+
+@pytest.fixture
+def backoff_delays(monkeypatch):
+    """Record retry backoff delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(yahoo.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _run_with_retry(fetcher, ticker: str = "AAA"):
+    async def main():
+        return await yahoo._fetch_with_retry(fetcher, ticker, asyncio.Semaphore(1), timeout=1.0)
+    return asyncio.run(main())
+
+
+def test_fetch_with_retry_backs_off_exponentially(backoff_delays):
+    fetcher = FlakyFetcher(failures=2)
+
+    assert _run_with_retry(fetcher).name == "AAA Inc"
+    assert fetcher.calls == 3
+    assert backoff_delays == [yahoo.FETCH_BACKOFF_SECONDS, 2 * yahoo.FETCH_BACKOFF_SECONDS]
+
+
+def test_fetch_with_retry_gives_up_after_last_attempt(backoff_delays):
+    fetcher = FlakyFetcher(failures=yahoo.FETCH_RETRIES)
+
+    with pytest.warns(UserWarning, match="AAA"):
+        assert _run_with_retry(fetcher) is None
+    assert fetcher.calls == yahoo.FETCH_RETRIES
+    assert len(backoff_delays) == yahoo.FETCH_RETRIES - 1
+
+
+def test_async_fetch_caps_concurrency(monkeypatch):
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fetcher(ticker):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return CompanyInfo(name=f"{ticker} Inc", ticker=ticker)
+
+    monkeypatch.setattr(yahoo, "fetch_company_info", fetcher)
+    tickers = [f"T{i}" for i in range(8)]
+
+    results = asyncio.run(yahoo.fetch_company_info_async(tickers, max_concurrency=2))
+
+    assert list(results) == tickers
+    assert peak == 2
+
+
+def test_fetch_company_info_many_rejects_running_loop():
+    async def main():
+        yahoo.fetch_company_info_many(["AAA"])
+
+    with pytest.raises(RuntimeError, match="fetch_company_info_async"):
+        asyncio.run(main())
+
+
+class RecordingInflight(dict):
+    """_inflight stand-in that signals once `lookups` callers have checked for a key."""
+
+    def __init__(self, lookups: int):
+        super().__init__()
+        self.lookups = lookups
+        self.seen = 0
+        self.ready = threading.Event()
+
+    def get(self, key, default=None):
+        self.seen += 1
+        if self.seen >= self.lookups:
+            self.ready.set()
+        return super().get(key, default)
+
+
+def _run_concurrently(monkeypatch, leader_fn, follower_fn):
+    """Start a leader and a follower for the same key; return each thread's outcome."""
+    inflight = RecordingInflight(lookups=2)
+    monkeypatch.setattr(yahoo, "_inflight", inflight)
+    release = threading.Event()
+    outcomes = {}
+
+    def call(name, fn):
+        try:
+            outcomes[name] = yahoo._singleflight(("key",), fn)
+        except Exception as exc:
+            outcomes[name] = exc
+
+    def blocking_leader():
+        release.wait(5)
+        return leader_fn()
+
+    leader = threading.Thread(target=call, args=("leader", blocking_leader))
+    follower = threading.Thread(target=call, args=("follower", follower_fn))
+    leader.start()
+    follower.start()
+    assert inflight.ready.wait(5)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    assert inflight == {}
+    return outcomes
+
+
+def test_singleflight_shares_result_with_concurrent_caller(monkeypatch):
+    calls = []
+
+    def leader_fn():
+        calls.append("leader")
+        return "result"
+
+    def follower_fn():
+        calls.append("follower")
+        return "other"
+
+    outcomes = _run_concurrently(monkeypatch, leader_fn, follower_fn)
+
+    assert outcomes == {"leader": "result", "follower": "result"}
+    assert calls == ["leader"]
+
+
+def test_singleflight_shares_exception_with_concurrent_caller(monkeypatch):
+    def leader_fn():
+        raise ValueError("bad payload")
+
+    outcomes = _run_concurrently(monkeypatch, leader_fn, lambda: "other")
+
+    assert isinstance(outcomes["leader"], ValueError)
+    assert outcomes["follower"] is outcomes["leader"]
+
+
+def test_coalesced_keys_on_arguments(monkeypatch):
+    keys = []
+    monkeypatch.setattr(yahoo, "_singleflight", lambda key, fn: keys.append(key) or fn())
+
+    @yahoo._coalesced
+    def fetch(ticker, limit=5):
+        return (ticker, limit)
+
+    assert fetch("AAA", limit=3) == ("AAA", 3)
+    assert keys == [("fetch", ("AAA",), (("limit", 3),))]
+
+
+def test_warmup_fills_cache(monkeypatch):
+    ticker = CountingTicker({"longName": "Acme Corp"})
+    monkeypatch.setattr(yahoo.yf, "Ticker", ticker)
+
+    futures = yahoo.warmup(["ACME"], include=("info",))
+    wait(futures, timeout=5)
+
+    assert [future.result() for future in futures] == [CompanyInfo(name="Acme Corp", ticker="ACME")]
+    assert yahoo.fetch_company_info("ACME").name == "Acme Corp"
+    assert ticker.calls == 1
+
+
+def test_warmup_failure_is_warned():
+    future = Future()
+    future.set_exception(ValueError("bad payload"))
+
+    with pytest.warns(UserWarning, match="warmup failed ACME: bad payload"):
+        yahoo._warn_on_failure("ACME", future)
+
+
+def test_cancelled_warmup_is_ignored():
+    future = Future()
+    future.cancel()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        yahoo._warn_on_failure("ACME", future)
+
+
+def test_batch_propagates_unexpected_errors(monkeypatch):
+    def ticker_factory(ticker):
+        raise TypeError("Ticker() got an unexpected keyword argument")
+
+    monkeypatch.setattr(yahoo.yf, "Ticker", ticker_factory)
+
+    with pytest.raises(TypeError):
+        yahoo.fetch_company_info_many(["CCC"])
+
+
+def test_fetch_news_json_without_orjson(monkeypatch):
+    news = [{
+        "title": "Acme \u2014 record quarter",
+        "link": "https://news.example/acme",
+        "publisher": "Example News",
+        "providerPublishTime": 1700000000,
+    }]
+    monkeypatch.setattr(yahoo.yf, "Ticker", lambda ticker: SimpleNamespace(news=news))
+    expected = yahoo.fetch_news_json("ACME")
+
+    monkeypatch.setattr(yahoo, "orjson", None)
+
+    assert yahoo.fetch_news_json("ACME") == expected
+    assert json.loads(expected) == [{
+        "title": "Acme \u2014 record quarter",
+        "link": "https://news.example/acme",
+        "publisher": "Example News",
+        "date": 1700000000,
+    }]